@@ -1,12 +1,21 @@
+import time
+# Début de l'exécution du script, avant tout import (rapport de démarrage)
+DEBUT_EXECUTION = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
-import time
+from collections import deque
+from datetime import datetime
+from urllib.parse import urlencode
+import hashlib
+import sys
+import threading
 import warnings
+from referentiels import ANNEES, TERRITOIRES, DOMAINES_FOCUS, ONGLETS
+from validation import valider_lot, integrer_lot
+from anomalies import DetecteurAnomalies, INDICATEURS_SURVEILLES
+from sections import CHARGEMENTS, charger_section
+FIN_IMPORTS = time.perf_counter()
 warnings.filterwarnings('ignore')
 
 # Configuration de la page
@@ -66,14 +75,203 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Modules lourds dont le rapport de démarrage indique s'ils sont chargés dans le processus
+# (plotly.graph_objects est déjà importé par Streamlit lui-même : seul plotly.express est différé)
+MODULES_LOURDS = ['plotly.express']
+
+# Intervalle du rafraîchissement automatique (secondes)
+DELAI_RAFRAICHISSEMENT = 300
+
+# Nombre de rapports de validation conservés pour l'affichage
+MAX_RAPPORTS_VALIDATION = 10
+
+# Vues filtrées gardées en cache (toutes sessions et empreintes confondues) ; les plus anciennes sont évincées
+MAX_VUES_EN_CACHE = 128
+
+# Attribut du dashboard alimenté par chaque jeu de données validé (initialisé par initialize_<attribut>)
+JEUX_DONNEES = {
+    'historical': 'historical_data',
+    'territorial': 'territorial_data',
+    'health': 'health_impact_data',
+    'social': 'social_indicators',
+}
+
+# Type de lot importé transmis au détecteur d'anomalies plutôt qu'à un jeu de données
+COMPTAGES_HEBDOMADAIRES = 'comptages hebdomadaires'
+
+# État d'une vue par défaut (les clés sont aussi les noms des paramètres d'URL)
+ETAT_PAR_DEFAUT = {
+    'debut': 2000,
+    'fin': 2023,
+    'territoires': ['Guadeloupe', 'Martinique', 'La Réunion', 'Mayotte'],
+    'focus': ['Consommation', 'Territoires'],
+    'projections': True,
+    'onglet': ONGLETS[0],
+}
+
+def _borner_annee(valeur, defaut):
+    """Convertit une année reçue (widget ou URL) et la ramène dans la période couverte"""
+    try:
+        annee = int(valeur)
+    except (TypeError, ValueError):
+        return defaut
+    return min(max(annee, ANNEES[0]), ANNEES[-1])
+
+def normaliser_etat(etat):
+    """Ramène un état de contrôles à sa forme canonique (bornes, ordre des listes, types)"""
+    debut = _borner_annee(etat.get('debut'), ETAT_PAR_DEFAUT['debut'])
+    fin = _borner_annee(etat.get('fin'), ETAT_PAR_DEFAUT['fin'])
+    territoires = set(etat.get('territoires', ETAT_PAR_DEFAUT['territoires']))
+    focus = set(etat.get('focus', ETAT_PAR_DEFAUT['focus']))
+    onglet = etat.get('onglet')
+    
+    return {
+        'debut': min(debut, fin),
+        'fin': max(debut, fin),
+        'territoires': [t for t in TERRITOIRES if t in territoires],
+        'focus': [d for d in DOMAINES_FOCUS if d in focus],
+        'projections': bool(etat.get('projections', ETAT_PAR_DEFAUT['projections'])),
+        'onglet': onglet if onglet in ONGLETS else ETAT_PAR_DEFAUT['onglet'],
+    }
+
+def parametres_url(etat):
+    """Paramètres d'URL reproduisant l'état, au format des widgets liés (listes répétées, true/false)"""
+    etat = normaliser_etat(etat)
+    return urlencode({
+        'debut': etat['debut'],
+        'fin': etat['fin'],
+        'territoires': etat['territoires'],
+        'focus': etat['focus'],
+        'projections': str(etat['projections']).lower(),
+        'onglet': etat['onglet'],
+    }, doseq=True)
+
+def cle_jeu(jeu, etat):
+    """Partie de l'état dont dépend la vue filtrée du jeu `jeu` (sa clé de cache)"""
+    if jeu == 'territorial':
+        return tuple(etat['territoires'])
+    return (etat['debut'], etat['fin'])
+
+@st.cache_data(show_spinner=False, max_entries=MAX_VUES_EN_CACHE)
+def charger_jeu(_dashboard, jeu, cle, empreinte):
+    """Jeu de données `jeu` filtré selon sa clé, partagé entre sessions et entre onglets
+
+    `empreinte` identifie les données chargées : un lot intégré invalide les vues en cache.
+    """
+    df = _dashboard.donnees(jeu)
+    if jeu == 'territorial':
+        df = df[df['territoire'].isin(cle)]
+    else:
+        df = df[df['annee'].between(*cle)]
+    return df.reset_index(drop=True)
+
+class MagasinDonnees:
+    """Jeux de données chargés, empreinte et rapports de validation communs à toutes les sessions"""
+    
+    def __init__(self):
+        self.jeux = {}
+        self.empreinte = 'initiale'
+        self.rapports = deque(maxlen=MAX_RAPPORTS_VALIDATION)
+        self.verrou = threading.RLock()
+
+@st.cache_resource
+def magasin_donnees():
+    """Magasin partagé par toutes les sessions : un lot intégré survit aux reruns"""
+    return MagasinDonnees()
+
+@st.cache_resource
+def detecteur_anomalies():
+    """Détecteur partagé par toutes les sessions : son état survit aux reruns"""
+    return DetecteurAnomalies()
+
 class AlcoholDROMCOMDashboard:
     def __init__(self):
-        self.historical_data = self.initialize_historical_data()
-        self.territorial_data = self.initialize_territorial_data()
-        self.policy_timeline = self.initialize_policy_timeline()
-        self.health_impact_data = self.initialize_health_impact_data()
-        self.social_indicators = self.initialize_social_indicators()
-        
+        self.etat_vue = normaliser_etat(ETAT_PAR_DEFAUT)
+        self.rapport_charge = {}
+        self.magasin = magasin_donnees()
+        self.detecteur = detecteur_anomalies()
+        self.chronometre = {}
+    
+    def donnees(self, jeu):
+        """Jeu de données `jeu` du magasin partagé, initialisé à son premier accès dans le processus"""
+        magasin = self.magasin
+        if jeu not in magasin.jeux:
+            with magasin.verrou:
+                if jeu not in magasin.jeux:
+                    magasin.jeux[jeu] = getattr(self, f'initialize_{JEUX_DONNEES[jeu]}')()
+        return magasin.jeux[jeu]
+    
+    @property
+    def historical_data(self):
+        return self.donnees('historical')
+    
+    @property
+    def territorial_data(self):
+        return self.donnees('territorial')
+    
+    @property
+    def health_impact_data(self):
+        return self.donnees('health')
+    
+    @property
+    def social_indicators(self):
+        return self.donnees('social')
+    
+    @property
+    def empreinte_donnees(self):
+        """Identifiant des données chargées, modifié par chaque lot intégré (clé des caches)"""
+        return self.magasin.empreinte
+    
+    @property
+    def rapports_validation(self):
+        return self.magasin.rapports
+    
+    def cle_vue(self, jeux):
+        """Clé de la vue courante restreinte aux jeux `jeux` : seul l'état dont ils dépendent y figure"""
+        return tuple((jeu, cle_jeu(jeu, self.etat_vue)) for jeu in jeux)
+    
+    def vue(self, cle):
+        """Jeux de données filtrés de la vue de clé `cle` (voir cle_vue), depuis le cache partagé"""
+        return {jeu: charger_jeu(self, jeu, cle_jeu_, self.empreinte_donnees) for jeu, cle_jeu_ in cle}
+    
+    def ingest_batch(self, jeu, lot):
+        """Valide un lot externe et intègre ses partitions acceptées au jeu de données `jeu`
+
+        Les partitions rejetées ou en quarantaine restent dans le rapport : les données
+        déjà chargées pour ces partitions sont conservées telles quelles. Le résultat est
+        enregistré dans le magasin partagé, donc visible de toutes les sessions.
+        """
+        magasin = self.magasin
+        with magasin.verrou:
+            existant = self.donnees(jeu)
+            rapport = valider_lot(lot, jeu, reference=existant)
+            magasin.rapports.append(rapport)
+            
+            if not rapport['acceptees'].empty:
+                magasin.jeux[jeu] = integrer_lot(existant, rapport['acceptees'], jeu)
+                empreinte_lot = pd.util.hash_pandas_object(rapport['acceptees'], index=False).values
+                magasin.empreinte = hashlib.sha1(
+                    f"{magasin.empreinte}:{jeu}".encode() + empreinte_lot.tobytes()
+                ).hexdigest()[:16]
+        return rapport
+    
+    def observe_weekly(self, lot):
+        """Transmet des comptages hebdomadaires par territoire au détecteur d'anomalies
+
+        Le lot est au format large : territoire, semaine (date) et une colonne par indicateur
+        suivi (voir anomalies.INDICATEURS_SURVEILLES). Renvoie les alertes levées par ce lot ;
+        lève ValueError si le lot n'est pas exploitable.
+        """
+        manquantes = [colonne for colonne in ('territoire', 'semaine') if colonne not in lot.columns]
+        if manquantes:
+            raise ValueError(f"colonnes manquantes : {', '.join(manquantes)}")
+        suivis = [colonne for colonnes in INDICATEURS_SURVEILLES.values() for colonne in colonnes]
+        if not any(colonne in lot.columns for colonne in suivis):
+            raise ValueError(f"aucun indicateur suivi parmi : {', '.join(suivis)}")
+        # Semaines lues en dates : le détecteur les traite dans l'ordre chronologique
+        lot = lot.assign(semaine=pd.to_datetime(lot['semaine']))
+        return self.detecteur.observer_lot(lot)
+    
     def initialize_historical_data(self):
         """Initialise les données historiques de la consommation d'alcool dans les DROM-COM"""
         years = list(range(2000, 2024))
@@ -113,13 +311,8 @@ class AlcoholDROMCOMDashboard:
     
     def initialize_territorial_data(self):
         """Initialise les données par territoire"""
-        territories = [
-            'Guadeloupe', 'Martinique', 'Guyane', 'La Réunion', 'Mayotte',
-            'Saint-Martin', 'Saint-Barthélemy', 'Polynésie française', 'Nouvelle-Calédonie'
-        ]
-        
         data = {
-            'territoire': territories,
+            'territoire': TERRITOIRES,
             'consommation_2023': [12.8, 11.5, 14.2, 13.1, 9.8, 15.6, 16.8, 10.9, 11.3],  # litres/pers/an
             'binge_drinking': [35.2, 32.8, 38.5, 34.1, 28.7, 42.3, 45.1, 31.6, 33.4],  # %
             'dependance_alcool': [9.2, 8.4, 11.8, 10.1, 7.3, 13.5, 14.8, 8.7, 9.5],  # %
@@ -130,27 +323,6 @@ class AlcoholDROMCOMDashboard:
         
         return pd.DataFrame(data)
     
-    def initialize_policy_timeline(self):
-        """Initialise la timeline des politiques spécifiques aux DROM-COM"""
-        return [
-            {'date': '2005-03-15', 'type': 'prevention', 'titre': 'Plan alcool outre-mer', 
-             'description': 'Premier plan spécifique de prévention de l\'alcoolisme dans les DROM-COM'},
-            {'date': '2010-09-01', 'type': 'regulation', 'titre': 'Encadrement des débits de boissons', 
-             'description': 'Renforcement de la régulation de la vente d\'alcool dans les outre-mer'},
-            {'date': '2014-01-01', 'type': 'treatment', 'titre': 'Centres addictologie outre-mer', 
-             'description': 'Création de centres spécialisés dans les territoires ultramarins'},
-            {'date': '2017-06-20', 'type': 'prevention', 'titre': 'Campagne "Alcool, parlons-en"', 
-             'description': 'Campagne de prévention adaptée aux cultures locales'},
-            {'date': '2019-11-01', 'type': 'regulation', 'titre': 'Interdiction publicité proximité écoles', 
-             'description': 'Interdiction de la publicité pour l\'alcool près des établissements scolaires'},
-            {'date': '2021-03-01', 'type': 'treatment', 'titre': 'Télémédecine addictologique', 
-             'description': 'Déploiement de la téléconsultation pour les addictions'},
-            {'date': '2022-09-01', 'type': 'prevention', 'titre': 'Programme "Jeunesse sans alcool"', 
-             'description': 'Prévention ciblée sur les jeunes des outre-mer'},
-            {'date': '2023-01-01', 'type': 'regulation', 'titre': 'Renforcement contrôles alcoolémie', 
-             'description': 'Multiplication des contrôles routiers dans les territoires'},
-        ]
-    
     def initialize_health_impact_data(self):
         """Initialise les données d'impact sur la santé"""
         years = list(range(2010, 2024))
@@ -206,7 +378,7 @@ class AlcoholDROMCOMDashboard:
                    unsafe_allow_html=True)
         
         current_data = self.historical_data[self.historical_data['annee'] == 2023].iloc[0]
-        health_data = self.health_impact_data[self.health_impact_data.index == 13].iloc[0]  # 2023
+        health_data = self.health_impact_data[self.health_impact_data['annee'] == 2023].iloc[0]
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -244,457 +416,54 @@ class AlcoholDROMCOMDashboard:
                 delta_color="inverse"
             )
     
-    def create_historical_analysis(self):
-        """Crée l'analyse historique de la consommation"""
-        st.markdown('<h3 class="section-header">📈 ÉVOLUTION HISTORIQUE DANS LES DROM-COM</h3>', 
-                   unsafe_allow_html=True)
-        
-        tab1, tab2, tab3 = st.tabs(["Consommation", "Impacts Santé", "Impacts Sociaux"])
-        
-        with tab1:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Évolution de la consommation
-                fig = px.line(self.historical_data, 
-                             x='annee', 
-                             y=['consommation_alcool', 'binge_drinking', 'dependance_alcool'],
-                             title='Évolution des Indicateurs de Consommation - 2000-2023',
-                             markers=True)
-                fig.update_layout(yaxis_title="Pourcentage (%) / Litres", xaxis_title="Année")
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Âge de première ivresse
-                fig = px.line(self.historical_data, 
-                             x='annee', 
-                             y='age_premiere_ivresse',
-                             title='Évolution de l\'Âge de Première Ivresse - 2000-2023',
-                             markers=True)
-                fig.add_hline(y=13.5, line_dash="dash", line_color="red", 
-                             annotation_text="Seuil de vigilance")
-                fig.update_layout(yaxis_title="Âge (années)", xaxis_title="Année")
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with tab2:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Impacts santé
-                fig = px.line(self.health_impact_data, 
-                             x='annee', 
-                             y=['deces_alcool', 'cancers_digesifs', 'cirrhoses'],
-                             title='Évolution de la Mortalité Liée à l\'Alcool - 2010-2023',
-                             markers=True)
-                fig.update_layout(yaxis_title="Nombre de cas", xaxis_title="Année")
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Hospitalisations et accidents
-                fig = px.area(self.health_impact_data, 
-                             x='annee', 
-                             y=['hospitalisations', 'accidents_route'],
-                             title='Hospitalisations et Accidents de la Route - 2010-2023')
-                fig.update_layout(yaxis_title="Nombre", xaxis_title="Année")
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with tab3:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Impacts sociaux
-                fig = px.line(self.social_indicators, 
-                             x='annee', 
-                             y=['violences_familiales', 'arrestations_ivresse'],
-                             title='Violences Familiales et Arrestations pour Ivresse - 2010-2023',
-                             markers=True)
-                fig.update_layout(yaxis_title="Nombre", xaxis_title="Année")
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Absentéisme et problèmes scolaires
-                fig = px.line(self.social_indicators, 
-                             x='annee', 
-                             y=['absenteisme_travail', 'problemes_scolaires'],
-                             title='Absentéisme et Problèmes Scolaires - 2010-2023',
-                             markers=True)
-                fig.update_layout(yaxis_title="Pourcentage (%)", xaxis_title="Année")
-                st.plotly_chart(fig, use_container_width=True)
-    
-    def create_territorial_analysis(self):
-        """Analyse des disparités territoriales"""
-        st.markdown('<h3 class="section-header">🗺️ DISPARITÉS TERRITORIALES</h3>', 
-                   unsafe_allow_html=True)
-        
-        tab1, tab2, tab3 = st.tabs(["Cartographie", "Comparaisons", "Facteurs Contextuels"])
-        
-        with tab1:
-            # Carte des territoires
-            st.subheader("Consommation d'Alcool par Territoire")
-            
-            # Coordonnées approximatives des territoires
-            territories_coords = {
-                'Guadeloupe': {'lat': 16.265, 'lon': -61.551, 'consommation': 12.8},
-                'Martinique': {'lat': 14.641, 'lon': -61.024, 'consommation': 11.5},
-                'Guyane': {'lat': 3.933, 'lon': -53.125, 'consommation': 14.2},
-                'La Réunion': {'lat': -21.115, 'lon': 55.536, 'consommation': 13.1},
-                'Mayotte': {'lat': -12.827, 'lon': 45.166, 'consommation': 9.8},
-                'Saint-Martin': {'lat': 18.070, 'lon': -63.050, 'consommation': 15.6},
-                'Saint-Barthélemy': {'lat': 17.900, 'lon': -62.850, 'consommation': 16.8},
-                'Polynésie française': {'lat': -17.679, 'lon': -149.407, 'consommation': 10.9},
-                'Nouvelle-Calédonie': {'lat': -21.300, 'lon': 165.300, 'consommation': 11.3}
-            }
-            
-            # Créer un DataFrame avec les coordonnées
-            coords_data = []
-            for territory, info in territories_coords.items():
-                coords_data.append({
-                    'territoire': territory,
-                    'lat': info['lat'],
-                    'lon': info['lon'],
-                    'consommation_alcool': info['consommation']
-                })
-            
-            coords_df = pd.DataFrame(coords_data)
-            
-            # Créer une carte scatter_geo
-            fig = px.scatter_geo(coords_df,
-                                lat='lat',
-                                lon='lon',
-                                color='consommation_alcool',
-                                size='consommation_alcool',
-                                hover_name='territoire',
-                                hover_data={'consommation_alcool': True},
-                                title='Consommation d\'Alcool par Territoire (litres/pers/an) - 2023',
-                                color_continuous_scale='RdYlGn_r',
-                                size_max=20,
-                                projection='natural earth')
-            
-            # Configuration de la carte
-            fig.update_geos(
-                visible=True,
-                showcountries=True,
-                countrycolor="black",
-                showsubunits=True,
-                subunitcolor="blue",
-                landcolor="lightgray",
-                oceancolor="lightblue",
-                bgcolor="white"
-            )
-            
-            fig.update_layout(
-                height=600,
-                geo=dict(
-                    bgcolor='rgba(255,255,255,0.1)'
-                )
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with tab2:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Classement par consommation
-                fig = px.bar(self.territorial_data.sort_values('consommation_2023'), 
-                            x='consommation_2023', 
-                            y='territoire',
-                            orientation='h',
-                            title='Consommation d\'Alcool par Territoire (L/pers/an)',
-                            color='consommation_2023',
-                            color_continuous_scale='RdYlGn_r')
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Classement par binge drinking
-                fig = px.bar(self.territorial_data.sort_values('binge_drinking'), 
-                            x='binge_drinking', 
-                            y='territoire',
-                            orientation='h',
-                            title='Binge Drinking par Territoire (%)',
-                            color='binge_drinking',
-                            color_continuous_scale='RdYlGn_r')
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with tab3:
-            # Facteurs contextuels spécifiques
-            st.subheader("Facteurs Influençant la Consommation")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                ### 🏝️ Facteurs Socio-culturels
-                
-                **Traditions et rituels:**
-                • Consommation cérémonielle  
-                • Importance sociale  
-                • Transmission générationnelle  
-                
-                **Normes sociales:**
-                • Tolérance élevée  
-                • Stigmatisation faible  
-                • Pression des pairs  
-                
-                **Contexte économique:**
-                • Prix relativement bas  
-                • Accessibilité importante  
-                • Marketing agressif  
-                """)
-            
-            with col2:
-                st.markdown("""
-                ### 🏥 Facteurs Structurels
-                
-                **Offre de soins:**
-                • Disparités territoriales  
-                • Accès aux CSAPA  
-                • Médecins addictologues  
-                
-                **Prévention:**
-                • Campagnes adaptées  
-                • Éducation scolaire  
-                • Dépistage précoce  
-                
-                **Régulation:**
-                • Application des lois  
-                • Contrôles de vente  
-                • Prévention commerciale  
-                """)
-    
-    def create_policy_analysis(self):
-        """Analyse des politiques de prévention"""
-        st.markdown('<h3 class="section-header">🏛️ POLITIQUES DE PRÉVENTION</h3>', 
-                   unsafe_allow_html=True)
-        
-        tab1, tab2, tab3 = st.tabs(["Timeline", "Efficacité", "Recommandations"])
-        
-        with tab1:
-            # Timeline interactive des politiques
-            policy_df = pd.DataFrame(self.policy_timeline)
-            policy_df['date'] = pd.to_datetime(policy_df['date'])
-            policy_df['annee'] = policy_df['date'].dt.year
-            
-            # Fusion avec données historiques
-            merged_data = pd.merge(self.historical_data, policy_df, on='annee', how='left')
-            
-            fig = px.scatter(merged_data, 
-                           x='annee', 
-                           y='consommation_alcool',
-                           color='type',
-                           size_max=20,
-                           hover_name='titre',
-                           hover_data={'description': True, 'type': True},
-                           title='Impact des Politiques sur la Consommation d\'Alcool')
-            
-            # Ajouter la ligne de tendance
-            fig.add_trace(go.Scatter(x=self.historical_data['annee'], 
-                                   y=self.historical_data['consommation_alcool'],
-                                   mode='lines',
-                                   name='Consommation alcool',
-                                   line=dict(color='gray', width=2)))
-            
-            fig.update_layout(showlegend=True)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Légende des types de politiques
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.markdown('<div class="policy-card policy-prevention">Prévention</div>', unsafe_allow_html=True)
-            with col2:
-                st.markdown('<div class="policy-card policy-regulation">Régulation</div>', unsafe_allow_html=True)
-            with col3:
-                st.markdown('<div class="policy-card policy-treatment">Prise en charge</div>', unsafe_allow_html=True)
-        
-        with tab2:
-            # Efficacité comparée des stratégies
-            st.subheader("Efficacité des Stratégies de Prévention")
-            
-            strategies = [
-                {'strategie': 'Prévention scolaire', 'efficacite': 7.8, 'cout': 4, 'acceptabilite': 9},
-                {'strategie': 'Contrôles d\'alcoolémie', 'efficacite': 8.5, 'cout': 6, 'acceptabilite': 6},
-                {'strategie': 'Limitation publicité', 'efficacite': 6.2, 'cout': 3, 'acceptabilite': 7},
-                {'strategie': 'Augmentation des prix', 'efficacite': 8.9, 'cout': 2, 'acceptabilite': 4},
-                {'strategie': 'Dépistage précoce', 'efficacite': 7.1, 'cout': 5, 'acceptabilite': 8},
-                {'strategie': 'CSAPA spécialisés', 'efficacite': 8.2, 'cout': 7, 'acceptabilite': 8},
-            ]
-            
-            strategy_df = pd.DataFrame(strategies)
-            
-            fig = px.scatter(strategy_df, 
-                           x='cout', 
-                           y='efficacite',
-                           size='acceptabilite',
-                           color='strategie',
-                           hover_name='strategie',
-                           title='Efficacité vs Coût des Stratégies',
-                           size_max=30)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with tab3:
-            st.subheader("Recommandations par Territoire")
-            
-            recommendations = {
-                'Guadeloupe': ['Renforcer prévention jeunes', 'Développer CSAPA', 'Contrôles renforcés'],
-                'Martinique': ['Campagne média', 'Formation professionnels', 'Prévention périnatale'],
-                'Guyane': ['Adaptation culturelle', 'Prévention communautaire', 'Renforcement soins'],
-                'La Réunion': ['Prévention scolaire', 'Dépistage systématique', 'Soins de suite'],
-                'Mayotte': ['Sensibilisation précoce', 'Formation tradipraticiens', 'Accès aux soins'],
-                'Saint-Martin': ['Régulation vente', 'Prévention touristique', 'Soins urgents'],
-                'Saint-Barthélemy': ['Prévention luxury', 'Contrôles événements', 'Soins privés'],
-                'Polynésie française': ['Prévention traditionnelle', 'Soins insulaires', 'Télémédecine'],
-                'Nouvelle-Calédonie': ['Prévention minière', 'Soins ruraux', 'Programmes workplace']
-            }
-            
-            selected_territory = st.selectbox("Sélectionnez un territoire:", list(recommendations.keys()))
-            
-            st.markdown(f"### Recommandations pour {selected_territory}")
-            for i, recommendation in enumerate(recommendations[selected_territory], 1):
-                st.write(f"{i}. {recommendation}")
-    
-    def create_strategic_recommendations(self):
-        """Recommandations stratégiques"""
-        st.markdown('<h3 class="section-header">🎯 STRATÉGIE NATIONALE ALCOOL DROM-COM</h3>', 
-                   unsafe_allow_html=True)
-        
-        tab1, tab2, tab3 = st.tabs(["Objectifs 2030", "Plan d'Action", "Indicateurs"])
-        
-        with tab1:
-            st.subheader("Stratégie Nationale 2024-2030")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("""
-                ### 🎯 Réduction Consommation
-                
-                **Objectifs quantitatifs:**
-                • -20% consommation globale  
-                • -30% binge drinking  
-                • -25% dépendance alcool  
-                
-                **Cibles prioritaires:**
-                • Jeunes 15-25 ans  
-                • Femmes enceintes  
-                • Populations vulnérables  
-                """)
-            
-            with col2:
-                st.markdown("""
-                ### 🏥 Amélioration Soins
-                
-                **Couverture territoriale:**
-                • 100% CSAPA accessibles  
-                • Délais < 15 jours  
-                • Télémédecine généralisée  
-                
-                **Qualité des soins:**
-                • Formation spécifique  
-                • Prise en charge globale  
-                • Suivi à long terme  
-                """)
-            
-            with col3:
-                st.markdown("""
-                ### 📚 Renforcement Prévention
-                
-                **Éducation:**
-                • Programmes scolaires  
-                • Formation enseignants  
-                • Sensibilisation parents  
-                
-                **Communautaire:**
-                • Leaders d'opinion  
-                • Associations locales  
-                • Médias territoriaux  
-                """)
-        
-        with tab2:
-            st.subheader("Plan d'Action Prioritaire")
-            
-            roadmap = [
-                {'periode': '2024-2025', 'actions': [
-                    'Cartographie des besoins',
-                    'Formation des professionnels', 
-                    'Campagne média territoriale'
-                ]},
-                {'periode': '2026-2027', 'actions': [
-                    'Déploiement CSAPA',
-                    'Programme scolaire unifié',
-                    'Système de dépistage'
-                ]},
-                {'periode': '2028-2030', 'actions': [
-                    'Évaluation stratégique',
-                    'Adjustement des programmes',
-                    'Généralisation des bonnes pratiques'
-                ]},
-            ]
-            
-            for step in roadmap:
-                with st.expander(f"📅 {step['periode']}"):
-                    for action in step['actions']:
-                        st.write(f"• {action}")
-        
-        with tab3:
-            st.subheader("Tableau de Bord de Suivi")
-            
-            indicators = [
-                {'indicateur': 'Consommation alcool (L/pers/an)', 'cible_2025': 9.5, 'cible_2030': 8.5},
-                {'indicateur': 'Binge drinking (%)', 'cible_2025': 28, 'cible_2030': 25},
-                {'indicateur': 'Âge 1ère ivresse (ans)', 'cible_2025': 12.5, 'cible_2030': 13.0},
-                {'indicateur': 'Décès liés à l\'alcool', 'cible_2025': 950, 'cible_2030': 850},
-                {'indicateur': 'Couverture CSAPA (%)', 'cible_2025': 85, 'cible_2030': 95},
-            ]
-            
-            indicators_df = pd.DataFrame(indicators)
-            st.dataframe(indicators_df, use_container_width=True)
-            
-            # Graphique de projection
-            years = list(range(2020, 2031))
-            consommation_projection = [11.2, 11.0, 10.8, 10.6, 10.2, 9.8, 9.5, 9.2, 8.9, 8.7, 8.5]
-            
-            fig = px.line(x=years, y=consommation_projection,
-                         title='Projection de la Consommation d\'Alcool 2020-2030',
-                         markers=True)
-            fig.add_hrect(y0=0, y1=8.5, line_width=0, fillcolor="green", opacity=0.2,
-                         annotation_text="Objectif 2030")
-            fig.update_layout(yaxis_title="Consommation (L/pers/an)", xaxis_title="Année")
-            st.plotly_chart(fig, use_container_width=True)
-    
     def create_sidebar(self):
         """Crée la sidebar avec les contrôles"""
         st.sidebar.markdown("## 🎛️ CONTRÔLES D'ANALYSE")
         
+        # Les contrôles de la vue sont liés aux paramètres d'URL (permalien partageable)
         # Période d'analyse
         st.sidebar.markdown("### 📅 Période d'analyse")
         annee_debut = st.sidebar.selectbox("Année de début", 
-                                         list(range(2000, 2024)), 
-                                         index=0)
+                                         ANNEES, 
+                                         index=ANNEES.index(ETAT_PAR_DEFAUT['debut']),
+                                         key='debut',
+                                         bind='query-params')
         annee_fin = st.sidebar.selectbox("Année de fin", 
-                                       list(range(2000, 2024)), 
-                                       index=23)
+                                       ANNEES, 
+                                       index=ANNEES.index(ETAT_PAR_DEFAUT['fin']),
+                                       key='fin',
+                                       bind='query-params')
         
         # Focus d'analyse
         st.sidebar.markdown("### 🎯 Focus d'analyse")
         focus_analysis = st.sidebar.multiselect(
             "Domaines à approfondir:",
-            ['Consommation', 'Santé', 'Social', 'Politiques', 'Territoires'],
-            default=['Consommation', 'Territoires']
+            DOMAINES_FOCUS,
+            default=ETAT_PAR_DEFAUT['focus'],
+            key='focus',
+            bind='query-params',
+            on_change=self.ordonner_selection, args=('focus', DOMAINES_FOCUS)
         )
         
         # Sélection des territoires
         st.sidebar.markdown("### 🏝️ Territoires")
         territories = st.sidebar.multiselect(
             "Territoires à inclure:",
-            ['Guadeloupe', 'Martinique', 'Guyane', 'La Réunion', 'Mayotte', 
-             'Saint-Martin', 'Saint-Barthélemy', 'Polynésie française', 'Nouvelle-Calédonie'],
-            default=['Guadeloupe', 'Martinique', 'La Réunion', 'Mayotte']
+            TERRITOIRES,
+            default=ETAT_PAR_DEFAUT['territoires'],
+            key='territoires',
+            bind='query-params',
+            on_change=self.ordonner_selection, args=('territoires', TERRITOIRES)
         )
         
         # Options d'affichage
         st.sidebar.markdown("### ⚙️ Options")
-        show_projections = st.sidebar.checkbox("Afficher les projections", value=True)
-        auto_refresh = st.sidebar.checkbox("Rafraîchissement automatique", value=False)
+        show_projections = st.sidebar.checkbox("Afficher les projections", 
+                                               value=ETAT_PAR_DEFAUT['projections'],
+                                               key='projections',
+                                               bind='query-params')
+        auto_refresh = st.sidebar.checkbox("Rafraîchissement automatique", value=False,
+                                           key='rafraichissement', bind='query-params')
         
         # Bouton d'export
         if st.sidebar.button("📊 Exporter l'analyse"):
@@ -709,100 +478,135 @@ class AlcoholDROMCOMDashboard:
             'auto_refresh': auto_refresh
         }
     
+    def create_import_panel(self):
+        """Import d'un lot CSV externe : validé puis intégré aux données partagées, ou
+        transmis au détecteur d'anomalies s'il s'agit de comptages hebdomadaires"""
+        with st.sidebar.expander("📥 Importer un lot de données"):
+            jeu = st.selectbox("Jeu de données", list(JEUX_DONNEES) + [COMPTAGES_HEBDOMADAIRES],
+                               key='lot_jeu')
+            fichier = st.file_uploader("Fichier CSV", type='csv', key='lot_fichier')
+            if fichier is not None and st.button("Valider et intégrer", key='lot_integrer'):
+                try:
+                    lot = pd.read_csv(fichier)
+                except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as exc:
+                    st.error(f"Fichier illisible : {exc}")
+                    return
+                if jeu == COMPTAGES_HEBDOMADAIRES:
+                    try:
+                        alertes = self.observe_weekly(lot)
+                    except ValueError as exc:
+                        st.error(f"Comptages inexploitables : {exc}")
+                        return
+                    st.success(f"{len(lot)} lignes observées, {len(alertes)} alertes levées")
+                    return
+                rapport = self.ingest_batch(jeu, lot)
+                st.success(f"{len(rapport['acceptees'])} lignes intégrées sur {rapport['lignes']}")
+    
+    @staticmethod
+    def ordonner_selection(cle, reference):
+        """Range une sélection multiple dans l'ordre canonique pour que l'URL reste stable"""
+        selection = set(st.session_state[cle])
+        st.session_state[cle] = [valeur for valeur in reference if valeur in selection]
+    
+    def display_payload_report(self):
+        """Affiche dans la sidebar les octets économisés par graphique"""
+        if not self.rapport_charge:
+            return
+        
+        total_avant = sum(avant for avant, _ in self.rapport_charge.values())
+        total_apres = sum(apres for _, apres in self.rapport_charge.values())
+        with st.sidebar.expander(f"📦 Charge des graphiques : {total_apres / 1024:.1f} Ko "
+                                 f"(-{total_avant - total_apres:,} octets)".replace(",", " ")):
+            rapport_df = pd.DataFrame(
+                [{'graphique': nom, 'avant': avant, 'après': apres,
+                  'gain (%)': round(100 * (avant - apres) / avant, 1)}
+                 for nom, (avant, apres) in self.rapport_charge.items()]
+            ).sort_values('avant', ascending=False)
+            st.dataframe(rapport_df, hide_index=True, use_container_width=True)
+    
+    def display_validation_report(self):
+        """Affiche dans la sidebar le résultat de la validation des lots intégrés"""
+        for rapport in reversed(self.rapports_validation):
+            statuts = rapport['partitions'].value_counts()
+            with st.sidebar.expander(f"🧪 Lot {rapport['jeu']} : {rapport['lignes']:,} lignes".replace(",", " ")):
+                st.markdown(
+                    f"✅ {statuts.get('acceptee', 0)} partitions acceptées · "
+                    f"⏸️ {statuts.get('quarantaine', 0)} en quarantaine · "
+                    f"⛔ {statuts.get('rejetee', 0)} rejetées "
+                    f"({rapport['duree']:.2f} s)"
+                )
+                if not rapport['anomalies'].empty:
+                    st.dataframe(rapport['anomalies'], hide_index=True, use_container_width=True)
+    
+    def display_startup_report(self, onglet):
+        """Affiche dans la sidebar les temps de démarrage du script et de chargement des sections"""
+        chrono = self.chronometre
+        with st.sidebar.expander(f"⏱️ Premier rendu : {1000 * chrono['premier_rendu']:.0f} ms"):
+            st.markdown(
+                f"Imports du script : {1000 * (FIN_IMPORTS - DEBUT_EXECUTION):.0f} ms · "
+                f"Onglet {onglet} : {1000 * chrono.get('onglet', 0):.0f} ms · "
+                f"Exécution totale : {1000 * chrono['total']:.0f} ms"
+            )
+            # Durées mesurées au premier import de chaque plugin dans ce processus
+            st.dataframe(
+                pd.DataFrame({'section': list(CHARGEMENTS),
+                              'chargement (ms)': [round(1000 * d, 1) for d in CHARGEMENTS.values()]}),
+                hide_index=True, use_container_width=True
+            )
+            st.caption("Modules lourds chargés : " + (", ".join(
+                module for module in MODULES_LOURDS if module in sys.modules) or "aucun"))
+    
     def run_dashboard(self):
         """Exécute le dashboard complet"""
         # Sidebar
         controls = self.create_sidebar()
+        self.create_import_panel()
         
         # Header
         self.display_header()
         
         # Métriques clés
         self.display_key_metrics()
+        self.chronometre['premier_rendu'] = time.perf_counter() - DEBUT_EXECUTION
+        
+        # Navigation par onglets (seul l'onglet ouvert est calculé)
+        tabs = st.tabs(ONGLETS, key='onglet', bind='query-params')
+        onglet = next((nom for nom, tab in zip(ONGLETS, tabs) if tab.open), ONGLETS[0])
+        
+        # État canonique de la vue : les caches de données et de figures n'en retiennent
+        # que la partie dont chaque jeu dépend (voir cle_jeu)
+        self.etat_vue = normaliser_etat({
+            'debut': controls['annee_debut'],
+            'fin': controls['annee_fin'],
+            'territoires': controls['territories'],
+            'focus': controls['focus_analysis'],
+            'projections': controls['show_projections'],
+            'onglet': onglet,
+        })
+        st.sidebar.caption(f"🔗 Vue partageable : ?{parametres_url(self.etat_vue)}")
         
-        # Navigation par onglets
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "📈 Évolution", 
-            "🗺️ Territoires", 
-            "🏛️ Politiques", 
-            "🎯 Stratégie",
-            "💡 Synthèse"
-        ])
-        
-        with tab1:
-            self.create_historical_analysis()
-        
-        with tab2:
-            self.create_territorial_analysis()
-        
-        with tab3:
-            self.create_policy_analysis()
+        # Le plugin de l'onglet ouvert est importé à son premier affichage (voir referentiels.SECTIONS)
+        for nom, tab in zip(ONGLETS, tabs):
+            if tab.open:
+                with tab:
+                    debut = time.perf_counter()
+                    charger_section(nom)(self).afficher()
+                    self.chronometre['onglet'] = time.perf_counter() - debut
+        self.chronometre['total'] = time.perf_counter() - DEBUT_EXECUTION
         
-        with tab4:
-            self.create_strategic_recommendations()
-        
-        with tab5:
-            st.markdown("## 💡 SYNTHÈSE STRATÉGIQUE")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                ### ⚠️ SITUATION ALARMANTE
-                
-                **Problématiques majeures:**
-                • Consommation supérieure à la métropole  
-                • Binge drinking très élevé chez les jeunes  
-                • Initiation précoce préoccupante  
-                • Mortalité liée significative  
-                
-                **Facteurs aggravants:**
-                • Traditions culturelles ancrées  
-                • Accessibilité importante  
-                • Offre de soins insuffisante  
-                • Prévention inadaptée  
-                """)
-            
-            with col2:
-                st.markdown("""
-                ### ✅ LEVIERS D'ACTION
-                
-                **Atouts territoriaux:**
-                • Structures communautaires fortes  
-                • Leadership local engagé  
-                • Expériences pilotes prometteuses  
-                
-                **Opportunités:**
-                • Plans nationaux spécifiques  
-                • Financements dédiés  
-                • Coopération régionale  
-                • Innovation numérique  
-                """)
-            
-            st.markdown("""
-            ### 🚨 RECOMMANDATIONS URGENTES
-            
-            **Priorité 1 - Prévention ciblée:**
-            1. Programmes scolaires adaptés aux cultures locales  
-            2. Campagnes média avec leaders d'opinion territoriaux  
-            3. Prévention communautaire par les pairs  
-            
-            **Priorité 2 - Soins accessibles:**
-            1. Renforcement des CSAPA dans tous les territoires  
-            2. Déploiement de la télémédecine addictologique  
-            3. Formation des professionnels de santé de première ligne  
-            
-            **Priorité 3 - Régulation adaptée:**
-            1. Contrôles renforcés de la vente aux mineurs  
-            2. Encadrement de la publicité proximité écoles  
-            3. Politique prix cohérente entre territoires  
-            
-            **Échéance: Plan d'action opérationnel pour 2024**
-            """)
+        self.display_payload_report()
+        self.display_validation_report()
+        self.display_startup_report(onglet)
         
         # Rafraîchissement automatique
+        st.session_state['derniere_execution'] = time.time()
         if controls['auto_refresh']:
-            time.sleep(300)
+            self.schedule_refresh()
+    
+    @st.fragment(run_every=DELAI_RAFRAICHISSEMENT)
+    def schedule_refresh(self):
+        """Relance le dashboard périodiquement sans bloquer le thread de la session"""
+        if time.time() - st.session_state['derniere_execution'] >= DELAI_RAFRAICHISSEMENT:
             st.rerun()
 
 # Lancement du dashboard
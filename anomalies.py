@@ -0,0 +1,159 @@
+"""Détection incrémentale de pics sur les séries hebdomadaires territoire × indicateur
+
+Chaque série garde une ligne de base robuste : un niveau et une composante saisonnière
+(une valeur par semaine de l'année), ainsi qu'une échelle de dispersion. Une nouvelle
+observation est comparée à la prévision niveau + saison : son z-score robuste déclenche
+une alerte au-delà du seuil. La mise à jour se fait en O(1) avec un résidu écrêté, pour
+qu'un pic n'entraîne pas la ligne de base. L'état complet d'une série tient dans
+quelques centaines d'octets, sans historique conservé.
+"""
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Indicateurs suivis, par jeu de données du dashboard
+INDICATEURS_SURVEILLES = {
+    'health': ['deces_alcool', 'hospitalisations', 'accidents_route'],
+    'social': ['violences_familiales', 'arrestations_ivresse'],
+}
+
+
+class DetecteurAnomalies:
+    """Détecteur de pics partagé par toutes les séries (territoire, indicateur)
+
+    Les états sont stockés dans des tableaux numpy indexés par série : niveau, échelle,
+    nombre d'observations, dernière semaine vue et saisonnalité (une ligne de `periode`
+    valeurs). Les observations d'une série doivent arriver dans l'ordre chronologique ;
+    une semaine déjà vue est ignorée.
+    """
+
+    def __init__(self, periode=52, alpha=0.3, gamma=0.3, beta=0.1, seuil=4.0,
+                 ecretage=2.0, rodage=8, comptage=True, max_alertes=500):
+        self.periode = periode      # longueur du cycle saisonnier (semaines)
+        self.alpha = alpha          # vitesse d'adaptation du niveau
+        self.gamma = gamma          # vitesse d'adaptation de la saisonnalité
+        self.beta = beta            # vitesse d'adaptation de l'échelle
+        self.seuil = seuil          # z-score robuste déclenchant une alerte
+        self.ecretage = ecretage    # résidu maximal (en échelles) pris en compte dans la mise à jour
+        self.rodage = rodage        # observations nécessaires avant toute alerte
+        self.comptage = comptage    # séries de comptage : échelle minimale de Poisson
+        self.alertes = deque(maxlen=max_alertes)
+        self.observations = 0
+
+        self.index = {}
+        self.niveau = np.zeros(0)
+        self.echelle = np.zeros(0)
+        self.n = np.zeros(0, dtype=np.int64)
+        self.derniere = np.zeros(0, dtype=np.int64)
+        self.saison = np.zeros((0, periode))
+        self._verrou = threading.Lock()
+
+    def _ligne(self, cle):
+        """Ligne de la série `cle` dans les tableaux d'état (créée au besoin)"""
+        ligne = self.index.get(cle)
+        if ligne is None:
+            ligne = self.index[cle] = len(self.index)
+            if ligne >= len(self.niveau):
+                self._agrandir(max(16, 2 * len(self.niveau)))
+        return ligne
+
+    def _agrandir(self, taille):
+        for nom in ('niveau', 'echelle', 'n', 'derniere', 'saison'):
+            ancien = getattr(self, nom)
+            nouveau = np.zeros((taille,) + ancien.shape[1:], dtype=ancien.dtype)
+            nouveau[:len(ancien)] = ancien
+            setattr(self, nom, nouveau)
+
+    def observer(self, territoire, indicateur, semaine, valeur):
+        """Intègre une observation hebdomadaire ; renvoie l'alerte levée, sinon None"""
+        semaine = pd.Timestamp(semaine)
+        jour = semaine.toordinal()
+        # La semaine 53 des années longues partage le créneau saisonnier de la semaine 52
+        k = (min(semaine.isocalendar().week, 52) - 1) % self.periode
+
+        with self._verrou:
+            i = self._ligne((territoire, indicateur))
+            n = self.n[i]
+            if n and jour <= self.derniere[i]:
+                return None
+            self.observations += 1
+            self.derniere[i] = jour
+            self.n[i] = n + 1
+            if n == 0:
+                self.niveau[i] = valeur
+                return None
+
+            prevision = self.niveau[i] + self.saison[i, k]
+            residu = valeur - prevision
+            plancher = np.sqrt(max(prevision, 1.0)) if self.comptage else 1e-9
+            echelle = max(self.echelle[i], plancher)
+            z = residu / echelle
+
+            alerte = None
+            if n >= self.rodage and z > self.seuil:
+                alerte = {
+                    'territoire': territoire,
+                    'indicateur': indicateur,
+                    'semaine': semaine.date(),
+                    'valeur': valeur,
+                    'attendu': round(float(prevision), 1),
+                    'z': round(float(z), 1),
+                }
+                self.alertes.append(alerte)
+
+            # Pendant le rodage les poids suivent une moyenne cumulée et rien n'est écrêté
+            if n < self.rodage:
+                r = residu
+                alpha, beta = max(self.alpha, 1 / (n + 1)), max(self.beta, 1 / (n + 1))
+            else:
+                r = min(max(residu, -self.ecretage * echelle), self.ecretage * echelle)
+                alpha, beta = self.alpha, self.beta
+            self.niveau[i] += alpha * r
+            self.saison[i, k] += self.gamma * (1 - alpha) * r
+            self.echelle[i] = np.sqrt((1 - beta) * self.echelle[i] ** 2 + beta * r ** 2)
+            return alerte
+
+    def observer_lot(self, lot):
+        """Intègre un lot au format large (territoire, semaine, une colonne par indicateur)
+
+        Renvoie les alertes levées par ce lot.
+        """
+        indicateurs = [colonne for colonnes in INDICATEURS_SURVEILLES.values()
+                       for colonne in colonnes if colonne in lot.columns]
+        alertes = []
+        for ligne in lot.sort_values('semaine').itertuples(index=False):
+            for indicateur in indicateurs:
+                valeur = getattr(ligne, indicateur)
+                if pd.isna(valeur):
+                    continue
+                alerte = self.observer(ligne.territoire, indicateur, ligne.semaine, float(valeur))
+                if alerte is not None:
+                    alertes.append(alerte)
+        return pd.DataFrame(alertes, columns=['territoire', 'indicateur', 'semaine',
+                                              'valeur', 'attendu', 'z'])
+
+    def alertes_recentes(self):
+        """Copie des dernières alertes levées, de la plus ancienne à la plus récente"""
+        with self._verrou:
+            return list(self.alertes)
+
+    def etat(self):
+        """Résumé de l'état de chaque série suivie"""
+        with self._verrou:
+            lignes = list(self.index.values())
+            cles = list(self.index.keys())
+            return pd.DataFrame({
+                'territoire': [territoire for territoire, _ in cles],
+                'indicateur': [indicateur for _, indicateur in cles],
+                'observations': self.n[lignes],
+                'niveau': self.niveau[lignes].round(1),
+                'echelle': self.echelle[lignes].round(2),
+            })
+
+    def taille_etat(self):
+        """Mémoire occupée par les tableaux d'état, en octets"""
+        with self._verrou:
+            return sum(getattr(self, nom).nbytes
+                       for nom in ('niveau', 'echelle', 'n', 'derniere', 'saison'))
@@ -0,0 +1 @@
+"""Configuration pytest : rend les modules de la racine du dépôt importables depuis tests/"""
@@ -0,0 +1,358 @@
+"""Test de charge du dashboard : sessions Streamlit simultanées sur un serveur local
+
+Le script démarre `streamlit run Dashboard.py`, puis ouvre N sessions websocket par palier.
+Chaque session enchaîne des changements d'onglet, de filtres et de rafraîchissement
+automatique (les contrôles étant liés à l'URL, chaque action est un rerun avec une
+nouvelle query string, comme lors d'un clic). Le rapport JSON produit peut être
+comparé d'une version à l'autre.
+
+Usage :
+    python load_test.py --paliers 1,2,4,8,16 --duree 20 --sortie charge_v2.json
+    python load_test.py --comparer charge_v1.json charge_v2.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from urllib.parse import urlencode
+
+import numpy as np
+import psutil
+import streamlit
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from referentiels import ANNEES, TERRITOIRES, DOMAINES_FOCUS, ONGLETS
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Dashboard.py')
+
+# Répartition des actions d'un utilisateur simulé
+ACTIONS = {'onglet': 0.5, 'filtres': 0.4, 'rafraichissement': 0.1}
+
+# Un palier est saturé si le débit progresse de moins de 10 % ou si le p95 dépasse ce facteur du premier palier
+GAIN_DEBIT_MIN = 1.10
+FACTEUR_P95_MAX = 4.0
+
+
+def port_libre():
+    """Port TCP libre sur la machine locale"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def demarrer_serveur(port, delai=60):
+    """Lance le dashboard en mode headless et attend qu'il réponde"""
+    processus = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP,
+         '--server.headless', 'true',
+         '--server.port', str(port),
+         '--server.fileWatcherType', 'none',
+         '--browser.gatherUsageStats', 'false'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    limite = time.time() + delai
+    while time.time() < limite:
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as reponse:
+                if reponse.status == 200:
+                    return processus
+        except OSError:
+            time.sleep(0.2)
+    processus.kill()
+    raise RuntimeError(f"Le serveur Streamlit n'a pas démarré en {delai} s")
+
+
+class MesureServeur(threading.Thread):
+    """Échantillonne le CPU et la mémoire (RSS) du processus serveur en tâche de fond"""
+
+    def __init__(self, pid, intervalle=0.25):
+        super().__init__(daemon=True)
+        self.processus = psutil.Process(pid)
+        self.intervalle = intervalle
+        self.rss_max = 0
+        self.arret = threading.Event()
+
+    def cpu(self):
+        temps = self.processus.cpu_times()
+        return temps.user + temps.system
+
+    def rss(self):
+        return self.processus.memory_info().rss
+
+    def run(self):
+        while not self.arret.wait(self.intervalle):
+            self.rss_max = max(self.rss_max, self.rss())
+
+    def reinitialiser(self):
+        self.rss_max = self.rss()
+
+
+class SessionSimulee:
+    """Un utilisateur : un websocket Streamlit et l'état courant de ses contrôles"""
+
+    def __init__(self, graine):
+        self.alea = random.Random(graine)
+        self.etat = {
+            'onglet': ONGLETS[0],
+            'debut': ANNEES[0],
+            'fin': ANNEES[-1],
+            'territoires': ['Guadeloupe', 'Martinique', 'La Réunion', 'Mayotte'],
+            'focus': ['Consommation', 'Territoires'],
+            'rafraichissement': False,
+        }
+
+    def query_string(self):
+        etat = dict(self.etat, rafraichissement=str(self.etat['rafraichissement']).lower())
+        return urlencode(etat, doseq=True)
+
+    def action(self):
+        """Modifie l'état comme le ferait un clic et renvoie le type d'action"""
+        action = self.alea.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+        if action == 'onglet':
+            self.etat['onglet'] = self.alea.choice(ONGLETS)
+        elif action == 'filtres':
+            debut, fin = sorted(self.alea.sample(ANNEES, 2))
+            self.etat.update(
+                debut=debut, fin=fin,
+                territoires=self.alea.sample(TERRITOIRES, self.alea.randint(1, len(TERRITOIRES))),
+                focus=self.alea.sample(DOMAINES_FOCUS, self.alea.randint(1, len(DOMAINES_FOCUS))),
+            )
+        else:
+            self.etat['rafraichissement'] = not self.etat['rafraichissement']
+        return action
+
+    async def rerun(self, ws, delai):
+        """Envoie un rerun et attend la fin du script ; renvoie (latence, octets, erreur ou None)"""
+        message = BackMsg()
+        message.rerun_script.query_string = self.query_string()
+        debut = time.perf_counter()
+        await ws.send(message.SerializeToString())
+
+        octets, erreur = 0, None
+        while True:
+            brut = await asyncio.wait_for(ws.recv(), delai)
+            octets += len(brut)
+            recu = ForwardMsg()
+            recu.ParseFromString(brut)
+            type_ = recu.WhichOneof('type')
+            if (type_ == 'delta' and recu.delta.WhichOneof('type') == 'new_element'
+                    and recu.delta.new_element.WhichOneof('type') == 'exception'):
+                exception = recu.delta.new_element.exception
+                erreur = f"{exception.type}: {exception.message}"
+            elif type_ == 'script_finished':
+                if recu.script_finished == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+                    continue
+                if recu.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    erreur = "erreur de compilation du script"
+                return time.perf_counter() - debut, octets, erreur
+
+
+async def executer_palier(url, sessions, duree, reflexion, delai, graine):
+    """Fait tourner `sessions` utilisateurs pendant `duree` secondes ; renvoie les mesures brutes"""
+    mesures = []
+    echecs = []
+    fin = time.perf_counter() + duree
+
+    async def utilisateur(numero):
+        session = SessionSimulee(graine + numero)
+        try:
+            async with websockets.connect(url, subprotocols=['streamlit'], max_size=None,
+                                          open_timeout=delai) as ws:
+                # Chargement initial de la page, hors statistiques de rerun
+                await session.rerun(ws, delai)
+                while time.perf_counter() < fin:
+                    await asyncio.sleep(session.alea.uniform(*reflexion))
+                    action = session.action()
+                    latence, octets, erreur = await session.rerun(ws, delai)
+                    mesures.append((action, latence, octets, erreur))
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as exc:
+            echecs.append(repr(exc))
+
+    await asyncio.gather(*(utilisateur(numero) for numero in range(sessions)))
+    return mesures, echecs
+
+
+def percentiles(valeurs):
+    """p50 / p90 / p95 / p99 / max en millisecondes"""
+    if not valeurs:
+        return {}
+    quantiles = np.percentile(valeurs, [50, 90, 95, 99, 100]) * 1000
+    return {cle: round(float(v), 1) for cle, v in zip(['p50', 'p90', 'p95', 'p99', 'max'], quantiles)}
+
+
+def point_de_saturation(paliers):
+    """Premier palier où le débit cesse de croître ou la latence p95 s'envole"""
+    reference = paliers[0]['latence_ms'].get('p95')
+    for precedent, palier in zip(paliers, paliers[1:]):
+        if palier['debit_reruns_s'] < GAIN_DEBIT_MIN * precedent['debit_reruns_s']:
+            return {'sessions': palier['sessions'],
+                    'raison': f"débit {palier['debit_reruns_s']} reruns/s contre "
+                              f"{precedent['debit_reruns_s']} à {precedent['sessions']} sessions"}
+        p95 = palier['latence_ms'].get('p95')
+        if reference and p95 and p95 > FACTEUR_P95_MAX * reference:
+            return {'sessions': palier['sessions'],
+                    'raison': f"p95 {p95} ms contre {reference} ms à {paliers[0]['sessions']} session(s)"}
+    return {'sessions': None, 'raison': "non atteinte sur les paliers testés"}
+
+
+def version_code():
+    """Commit courant du dépôt, s'il est disponible"""
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True,
+                              text=True, cwd=os.path.dirname(APP), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def lancer(args):
+    """Démarre le serveur, exécute les paliers et renvoie le rapport"""
+    port = port_libre()
+    serveur = demarrer_serveur(port)
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    mesure = MesureServeur(serveur.pid)
+    mesure.start()
+
+    try:
+        # Préchauffage : une session parcourt chaque onglet pour remplir les caches
+        prechauffage = SessionSimulee(args.graine)
+
+        async def prechauffer():
+            async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as ws:
+                for onglet in ONGLETS:
+                    prechauffage.etat['onglet'] = onglet
+                    await prechauffage.rerun(ws, args.delai)
+
+        asyncio.run(prechauffer())
+        rss_repos = mesure.rss()
+
+        paliers = []
+        for sessions in args.paliers:
+            mesure.reinitialiser()
+            cpu_debut = mesure.cpu()
+            debut = time.perf_counter()
+            mesures, echecs = asyncio.run(executer_palier(
+                url, sessions, args.duree, args.reflexion, args.delai, args.graine
+            ))
+            duree = time.perf_counter() - debut
+            cpu = mesure.cpu() - cpu_debut
+
+            latences = [latence for _, latence, _, _ in mesures]
+            palier = {
+                'sessions': sessions,
+                'reruns': len(mesures),
+                'erreurs': sum(erreur is not None for *_, erreur in mesures) + len(echecs),
+                'debit_reruns_s': round(len(mesures) / duree, 2),
+                'latence_ms': percentiles(latences),
+                'latence_ms_par_action': {
+                    action: percentiles([l for a, l, _, _ in mesures if a == action]) for action in ACTIONS
+                },
+                'octets_par_rerun': int(np.mean([o for _, _, o, _ in mesures])) if mesures else 0,
+                'cpu_serveur_pct': round(100 * cpu / duree, 1),
+                'cpu_par_session_pct': round(100 * cpu / duree / sessions, 2),
+                'cpu_ms_par_rerun': round(1000 * cpu / len(mesures), 1) if mesures else None,
+                'rss_max_mo': round(mesure.rss_max / 2**20, 1),
+                'rss_par_session_mo': round((mesure.rss_max - rss_repos) / 2**20 / sessions, 2),
+            }
+            exceptions = sorted({erreur for *_, erreur in mesures if erreur is not None})
+            if exceptions:
+                palier['exceptions'] = exceptions[:5]
+            if echecs:
+                palier['echecs_connexion'] = echecs[:5]
+            paliers.append(palier)
+            afficher_palier(palier)
+    finally:
+        mesure.arret.set()
+        serveur.terminate()
+        serveur.wait(timeout=10)
+
+    return {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'version': version_code(),
+            'streamlit': streamlit.__version__,
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+            'parametres': {'paliers': args.paliers, 'duree_s': args.duree,
+                           'reflexion_s': list(args.reflexion), 'graine': args.graine},
+        },
+        'rss_repos_mo': round(rss_repos / 2**20, 1),
+        'paliers': paliers,
+        'saturation': point_de_saturation(paliers),
+    }
+
+
+def afficher_palier(palier):
+    latence = palier['latence_ms']
+    print(f"{palier['sessions']:>4} sessions | {palier['reruns']:>5} reruns "
+          f"| {palier['debit_reruns_s']:>6} /s | p50 {latence.get('p50', '-'):>7} ms "
+          f"| p95 {latence.get('p95', '-'):>7} ms | p99 {latence.get('p99', '-'):>7} ms "
+          f"| CPU {palier['cpu_serveur_pct']:>5} % | CPU/session {palier['cpu_par_session_pct']:>5} % "
+          f"| RSS/session {palier['rss_par_session_mo']:>6} Mo "
+          f"| erreurs {palier['erreurs']}")
+
+
+def comparer(ancien, nouveau):
+    """Affiche l'écart entre deux rapports, palier par palier"""
+    def ecart(a, b):
+        if a in (None, 0) or b is None:
+            return '   n/a'
+        return f"{100 * (b - a) / a:+6.1f}%"
+
+    print(f"{ancien['meta']['version']} -> {nouveau['meta']['version']}")
+    precedents = {palier['sessions']: palier for palier in ancien['paliers']}
+    for palier in nouveau['paliers']:
+        avant = precedents.get(palier['sessions'])
+        if avant is None:
+            continue
+        print(f"{palier['sessions']:>4} sessions | débit {ecart(avant['debit_reruns_s'], palier['debit_reruns_s'])} "
+              f"| p50 {ecart(avant['latence_ms'].get('p50'), palier['latence_ms'].get('p50'))} "
+              f"| p95 {ecart(avant['latence_ms'].get('p95'), palier['latence_ms'].get('p95'))} "
+              f"| CPU/rerun {ecart(avant['cpu_ms_par_rerun'], palier['cpu_ms_par_rerun'])} "
+              f"| CPU/session {ecart(avant.get('cpu_par_session_pct'), palier['cpu_par_session_pct'])} "
+              f"| RSS/session {ecart(avant['rss_par_session_mo'], palier['rss_par_session_mo'])}")
+    print(f"saturation : {ancien['saturation']['sessions']} -> {nouveau['saturation']['sessions']} sessions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paliers', default='1,2,4,8,16',
+                        type=lambda v: [int(n) for n in v.split(',')],
+                        help="nombres de sessions simultanées testés (défaut : 1,2,4,8,16)")
+    parser.add_argument('--duree', type=float, default=20, help="durée de chaque palier en secondes")
+    parser.add_argument('--reflexion', type=float, nargs=2, default=(0.5, 2.0), metavar=('MIN', 'MAX'),
+                        help="temps de réflexion entre deux actions, en secondes")
+    parser.add_argument('--delai', type=float, default=60, help="délai maximal d'un rerun en secondes")
+    parser.add_argument('--graine', type=int, default=0, help="graine des scénarios utilisateurs")
+    parser.add_argument('--sortie', default='rapport_charge.json', help="fichier du rapport JSON")
+    parser.add_argument('--comparer', nargs=2, metavar=('ANCIEN', 'NOUVEAU'),
+                        help="compare deux rapports existants au lieu de lancer un test")
+    args = parser.parse_args()
+
+    if args.comparer:
+        rapports = []
+        for chemin in args.comparer:
+            with open(chemin, encoding='utf-8') as f:
+                rapports.append(json.load(f))
+        comparer(*rapports)
+        return
+
+    rapport = lancer(args)
+    with open(args.sortie, 'w', encoding='utf-8') as f:
+        json.dump(rapport, f, ensure_ascii=False, indent=2)
+    print(f"saturation : {rapport['saturation']['sessions']} sessions ({rapport['saturation']['raison']})")
+    print(f"rapport écrit dans {args.sortie}")
+
+
+if __name__ == '__main__':
+    main()
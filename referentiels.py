@@ -0,0 +1,31 @@
+"""Référentiels communs au dashboard et aux traitements de données (sans dépendance Streamlit)"""
+from datetime import date
+
+# Période couverte par les séries annuelles : elle s'étend jusqu'à l'année en cours, dernière
+# année qu'un lot validé peut apporter, pour que toute année intégrée soit sélectionnable
+ANNEE_DEBUT = 2000
+ANNEE_FIN = date.today().year
+ANNEES = list(range(ANNEE_DEBUT, ANNEE_FIN + 1))
+
+# Territoires suivis, dans l'ordre canonique d'affichage
+TERRITOIRES = [
+    'Guadeloupe', 'Martinique', 'Guyane', 'La Réunion', 'Mayotte',
+    'Saint-Martin', 'Saint-Barthélemy', 'Polynésie française', 'Nouvelle-Calédonie'
+]
+
+# Domaines d'analyse proposés dans la sidebar
+DOMAINES_FOCUS = ['Consommation', 'Santé', 'Social', 'Politiques', 'Territoires']
+
+# Sections du dashboard, dans l'ordre des onglets : libellé -> plugin "module:Classe"
+# (le module n'est importé qu'au premier affichage de l'onglet, voir sections/__init__.py)
+SECTIONS = {
+    "📈 Évolution": 'sections.evolution:SectionEvolution',
+    "🗺️ Territoires": 'sections.territoires:SectionTerritoires',
+    "🏛️ Politiques": 'sections.politiques:SectionPolitiques',
+    "🎯 Stratégie": 'sections.strategie:SectionStrategie',
+    "🚨 Alertes": 'sections.alertes:SectionAlertes',
+    "💡 Synthèse": 'sections.synthese:SectionSynthese',
+}
+
+# Onglets principaux du dashboard (leur libellé est aussi la valeur du paramètre d'URL `onglet`)
+ONGLETS = list(SECTIONS)
@@ -0,0 +1,40 @@
+"""Sections du dashboard, chargées à la demande
+
+Chaque onglet est un plugin déclaré dans `referentiels.SECTIONS` sous la forme "module:Classe".
+Le module n'est importé qu'au premier affichage de son onglet : ses dépendances lourdes
+(plotly.express) et ses données propres ne coûtent rien tant que l'onglet n'a pas été ouvert.
+Ajouter une section revient à créer un module dans ce paquet et à l'inscrire dans SECTIONS.
+"""
+import importlib
+import time
+from abc import ABC, abstractmethod
+
+from referentiels import SECTIONS
+
+# Durée du premier import de chaque plugin dans le processus (secondes), par onglet
+CHARGEMENTS = {}
+
+
+class Section(ABC):
+    """Section affichée dans un onglet du dashboard
+
+    `jeux` liste les jeux de données (clés de JEUX_DONNEES) dont la vue filtrée est utilisée.
+    """
+    jeux = ()
+
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+
+    @abstractmethod
+    def afficher(self):
+        """Affiche le contenu de l'onglet"""
+
+
+def charger_section(onglet):
+    """Classe du plugin de l'onglet `onglet`, dont le module est importé au premier appel"""
+    chemin, classe = SECTIONS[onglet].split(':')
+    if onglet not in CHARGEMENTS:
+        debut = time.perf_counter()
+        importlib.import_module(chemin)
+        CHARGEMENTS[onglet] = time.perf_counter() - debut
+    return getattr(importlib.import_module(chemin), classe)
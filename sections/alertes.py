@@ -0,0 +1,41 @@
+"""Onglet Alertes : pics détectés sur les comptages hebdomadaires sanitaires et sociaux"""
+import pandas as pd
+import streamlit as st
+
+from sections import Section
+
+
+class SectionAlertes(Section):
+    
+    def afficher(self):
+        """Alertes de pics sur les indicateurs sanitaires et sociaux hebdomadaires"""
+        st.markdown('<h3 class="section-header">🚨 ALERTES SANITAIRES ET SOCIALES</h3>', 
+                   unsafe_allow_html=True)
+        
+        detecteur = self.dashboard.detecteur
+        alertes = pd.DataFrame(detecteur.alertes_recentes(),
+                               columns=['territoire', 'indicateur', 'semaine', 'valeur', 'attendu', 'z'])
+        alertes = alertes[alertes['territoire'].isin(self.dashboard.etat_vue['territoires'])]
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Séries suivies", len(detecteur.index))
+        with col2:
+            st.metric("Observations", f"{detecteur.observations:,}".replace(",", " "))
+        with col3:
+            st.metric("Alertes (territoires sélectionnés)", len(alertes))
+        with col4:
+            st.metric("Mémoire du détecteur", f"{detecteur.taille_etat() / 1024:.1f} Ko")
+        
+        if alertes.empty:
+            st.info("Aucune alerte : les derniers comptages hebdomadaires restent dans leur ligne de base.")
+            if not detecteur.index:
+                st.caption("Les comptages hebdomadaires (territoire, semaine, une colonne par indicateur) "
+                           "s'importent depuis « 📥 Importer un lot de données », type "
+                           "« comptages hebdomadaires ».")
+        else:
+            st.dataframe(alertes.sort_values('semaine', ascending=False),
+                         hide_index=True, use_container_width=True)
+        
+        with st.expander("Lignes de base par territoire et indicateur"):
+            st.dataframe(detecteur.etat(), hide_index=True, use_container_width=True)
@@ -0,0 +1,108 @@
+"""Onglet Évolution : consommation, impacts santé et impacts sociaux depuis 2000"""
+import plotly.express as px
+import streamlit as st
+
+from sections.graphiques import SectionGraphique, periode
+
+
+class SectionEvolution(SectionGraphique):
+    jeux = ('historical', 'health', 'social')
+    
+    def afficher(self):
+        """Crée l'analyse historique de la consommation"""
+        st.markdown('<h3 class="section-header">📈 ÉVOLUTION HISTORIQUE DANS LES DROM-COM</h3>', 
+                   unsafe_allow_html=True)
+        
+        tab1, tab2, tab3 = st.tabs(["Consommation", "Impacts Santé", "Impacts Sociaux"])
+        (fig_consommation, fig_age, fig_mortalite,
+         fig_hospitalisations, fig_violences, fig_absenteisme) = self.figures(
+            'consommation', 'age_ivresse', 'mortalite',
+            'hospitalisations', 'violences', 'absenteisme')
+        
+        with tab1:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.plotly_chart(fig_consommation, use_container_width=True)
+            
+            with col2:
+                st.plotly_chart(fig_age, use_container_width=True)
+        
+        with tab2:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.plotly_chart(fig_mortalite, use_container_width=True)
+            
+            with col2:
+                st.plotly_chart(fig_hospitalisations, use_container_width=True)
+        
+        with tab3:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.plotly_chart(fig_violences, use_container_width=True)
+            
+            with col2:
+                st.plotly_chart(fig_absenteisme, use_container_width=True)
+    
+    def figure_consommation(self, vue):
+        """Évolution des indicateurs de consommation"""
+        fig = px.line(vue['historical'], 
+                     x='annee', 
+                     y=['consommation_alcool', 'binge_drinking', 'dependance_alcool'],
+                     title=f"Évolution des Indicateurs de Consommation - {periode(vue['historical'])}",
+                     markers=True)
+        fig.update_layout(yaxis_title="Pourcentage (%) / Litres", xaxis_title="Année")
+        return fig
+    
+    def figure_age_ivresse(self, vue):
+        """Âge de première ivresse"""
+        fig = px.line(vue['historical'], 
+                     x='annee', 
+                     y='age_premiere_ivresse',
+                     title=f"Évolution de l'Âge de Première Ivresse - {periode(vue['historical'])}",
+                     markers=True)
+        fig.add_hline(y=13.5, line_dash="dash", line_color="red", 
+                     annotation_text="Seuil de vigilance")
+        fig.update_layout(yaxis_title="Âge (années)", xaxis_title="Année")
+        return fig
+    
+    def figure_mortalite(self, vue):
+        """Impacts santé"""
+        fig = px.line(vue['health'], 
+                     x='annee', 
+                     y=['deces_alcool', 'cancers_digesifs', 'cirrhoses'],
+                     title=f"Évolution de la Mortalité Liée à l'Alcool - {periode(vue['health'])}",
+                     markers=True)
+        fig.update_layout(yaxis_title="Nombre de cas", xaxis_title="Année")
+        return fig
+    
+    def figure_hospitalisations(self, vue):
+        """Hospitalisations et accidents"""
+        fig = px.area(vue['health'], 
+                     x='annee', 
+                     y=['hospitalisations', 'accidents_route'],
+                     title=f"Hospitalisations et Accidents de la Route - {periode(vue['health'])}")
+        fig.update_layout(yaxis_title="Nombre", xaxis_title="Année")
+        return fig
+    
+    def figure_violences(self, vue):
+        """Impacts sociaux"""
+        fig = px.line(vue['social'], 
+                     x='annee', 
+                     y=['violences_familiales', 'arrestations_ivresse'],
+                     title=f"Violences Familiales et Arrestations pour Ivresse - {periode(vue['social'])}",
+                     markers=True)
+        fig.update_layout(yaxis_title="Nombre", xaxis_title="Année")
+        return fig
+    
+    def figure_absenteisme(self, vue):
+        """Absentéisme et problèmes scolaires"""
+        fig = px.line(vue['social'], 
+                     x='annee', 
+                     y=['absenteisme_travail', 'problemes_scolaires'],
+                     title=f"Absentéisme et Problèmes Scolaires - {periode(vue['social'])}",
+                     markers=True)
+        fig.update_layout(yaxis_title="Pourcentage (%)", xaxis_title="Année")
+        return fig
@@ -0,0 +1,222 @@
+"""Construction, mise en cache et compaction des figures Plotly des sections
+
+Importé par les seules sections graphiques, à l'ouverture du premier onglet qui affiche
+un graphique (plotly.graph_objects est de toute façon déjà chargé par Streamlit).
+"""
+import base64
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from sections import Section
+
+# Construction des figures d'une section : en parallèle (pool de threads) ou l'une après l'autre.
+# Désactivée par défaut : la construction Plotly est du Python pur tenu par le GIL, et les mesures
+# sur les 6 figures de l'onglet Évolution ne montrent aucun gain (249 ms en séquentiel contre
+# 238 ms en threads avec 24 lignes, 314 contre 366 ms avec 20 000 lignes).
+# DASHBOARD_CONSTRUCTION_PARALLELE=1 dans l'environnement du serveur l'active.
+CONSTRUCTION_PARALLELE = os.environ.get('DASHBOARD_CONSTRUCTION_PARALLELE', '0') == '1'
+MAX_THREADS_FIGURES = 6
+
+# Précision d'affichage (décimales) des données envoyées aux graphiques ; None désactive la compaction
+PRECISION_AFFICHAGE = 2
+
+# Figures gardées en cache par étape (construction, compaction) : chaque période, sélection de
+# territoires ou lot intégré crée une entrée, les plus anciennes sont évincées
+MAX_FIGURES_EN_CACHE = 256
+
+# Clés des dernières figures construites dans ce processus, bornées comme le cache des figures :
+# leur lecture en cache ne justifie pas de pool (une clé évincée entre-temps est simplement
+# reconstruite sans pool)
+FIGURES_CONSTRUITES = OrderedDict()
+_VERROU_FIGURES = threading.Lock()
+
+def _marquer_construite(cle):
+    """Enregistre la figure de clé `cle` comme construite, en oubliant les plus anciennes"""
+    with _VERROU_FIGURES:
+        FIGURES_CONSTRUITES[cle] = None
+        FIGURES_CONSTRUITES.move_to_end(cle)
+        while len(FIGURES_CONSTRUITES) > MAX_FIGURES_EN_CACHE:
+            FIGURES_CONSTRUITES.popitem(last=False)
+
+def periode(df):
+    """Libellé de la période couverte par un jeu de données annuel"""
+    if df.empty:
+        return "aucune donnée"
+    return f"{df['annee'].min()}-{df['annee'].max()}"
+
+@st.cache_data(show_spinner=False, max_entries=MAX_FIGURES_EN_CACHE)
+def construire_figure(_section, cle, nom, empreinte):
+    """Construit la figure `nom` une seule fois par clé, c'est-à-dire par état des jeux dont elle dépend"""
+    return getattr(_section, f'figure_{nom}')(_section.dashboard.vue(cle))
+
+# Attributs de trace pouvant déjà porter une colonne dupliquée dans customdata
+ATTRIBUTS_SURVOL = [('x',), ('y',), ('lat',), ('lon',), ('text',), ('hovertext',),
+                    ('marker', 'color'), ('marker', 'size')]
+# Sous-graphes du template à ne conserver que si la figure les utilise
+SOUS_GRAPHES_TEMPLATE = ('xaxis', 'yaxis', 'coloraxis', 'geo', 'polar', 'ternary',
+                         'scene', 'mapbox', 'map', 'smith')
+REF_CUSTOMDATA = re.compile(r'%\{customdata\[(\d+)\]([^}]*)\}')
+
+def _decoder_tableau(valeur):
+    """Tableau numpy d'un attribut de trace numérique (liste, ndarray ou tableau typé Plotly), sinon None"""
+    if isinstance(valeur, dict) and 'bdata' in valeur:
+        tableau = np.frombuffer(base64.b64decode(valeur['bdata']), dtype=valeur['dtype'])
+        if 'shape' in valeur:
+            tableau = tableau.reshape([int(n) for n in str(valeur['shape']).split(',')])
+        return tableau
+    if isinstance(valeur, np.ndarray):
+        return valeur
+    if (isinstance(valeur, (list, tuple)) and valeur
+            and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in valeur)):
+        return np.asarray(valeur)
+    return None
+
+def _valeurs(valeur):
+    """Liste des valeurs d'un attribut de trace quel que soit son encodage"""
+    tableau = _decoder_tableau(valeur)
+    if tableau is not None:
+        return tableau.tolist()
+    return list(valeur) if isinstance(valeur, (list, tuple)) else None
+
+def _dedupliquer_customdata(trace):
+    """Retire de customdata les colonnes non affichées, déjà portées par un autre attribut
+    ou constantes sur la trace (écrites alors en toutes lettres dans le hovertemplate)"""
+    hovertemplate = trace.get('hovertemplate')
+    if 'customdata' not in trace or not isinstance(hovertemplate, str):
+        return
+    customdata = _decoder_tableau(trace['customdata'])
+    if customdata is None:
+        customdata = np.asarray(trace['customdata'], dtype=object)
+    if customdata.ndim == 1:
+        customdata = customdata.reshape(-1, 1)
+    if customdata.shape[0] == 0:
+        # Trace sans point (filtre vide) : rien à comparer
+        return
+    
+    remplacements, constantes, gardees = {}, {}, []
+    for j in range(customdata.shape[1]):
+        if f'%{{customdata[{j}]' not in hovertemplate:
+            continue
+        colonne = customdata[:, j].tolist()
+        # Texte identique sur tous les points (ex. la catégorie d'une trace `color=`)
+        if (isinstance(colonne[0], str) and '%{' not in colonne[0] and colonne.count(colonne[0]) == len(colonne)
+                and f'%{{customdata[{j}]:' not in hovertemplate):
+            constantes[j] = colonne[0]
+            continue
+        for chemin in ATTRIBUTS_SURVOL:
+            valeur = trace
+            for cle in chemin:
+                valeur = valeur.get(cle) if isinstance(valeur, dict) else None
+            if _valeurs(valeur) == colonne:
+                remplacements[j] = '%{' + '.'.join(chemin)
+                break
+        else:
+            remplacements[j] = f'%{{customdata[{len(gardees)}]'
+            gardees.append(j)
+    
+    def remplacer(m):
+        j = int(m.group(1))
+        if j in constantes:
+            return constantes[j]
+        return remplacements[j] + m.group(2) + '}'
+    
+    trace['hovertemplate'] = REF_CUSTOMDATA.sub(remplacer, hovertemplate)
+    if gardees:
+        customdata = customdata[:, gardees]
+        trace['customdata'] = customdata if customdata.dtype.kind in 'iuf' else customdata.tolist()
+    else:
+        del trace['customdata']
+
+def _arrondir_tableaux(noeud, precision):
+    """Arrondit les tableaux de flottants d'une trace ; les scalaires (tailles, échelles) sont conservés"""
+    for cle, valeur in noeud.items():
+        if isinstance(valeur, dict) and 'bdata' not in valeur:
+            _arrondir_tableaux(valeur, precision)
+            continue
+        tableau = _decoder_tableau(valeur)
+        if tableau is None or tableau.dtype.kind != 'f':
+            continue
+        tableau = np.round(tableau, precision)
+        if np.isfinite(tableau).all() and (tableau == np.trunc(tableau)).all():
+            # Plotly réencode les entiers en tableau typé de la plus petite largeur
+            noeud[cle] = tableau.astype(np.int64)
+        else:
+            # Quelques décimales en JSON sont plus courtes qu'un float64 en base64
+            noeud[cle] = tableau.tolist()
+
+def compacter_figure(fig, precision=PRECISION_AFFICHAGE):
+    """Réduit la charge utile d'une figure ; renvoie (spec, octets avant, octets après)"""
+    avant = len(pio.to_json(fig, validate=False))
+    spec = fig.to_dict()
+    
+    # Template : seules les traces et sous-graphes réellement présents sont gardés
+    template = spec['layout'].get('template')
+    if isinstance(template, dict):
+        types_traces = {trace.get('type', 'scatter') for trace in spec['data']}
+        template['data'] = {t: v for t, v in template.get('data', {}).items() if t in types_traces}
+        template['layout'] = {k: v for k, v in template.get('layout', {}).items()
+                              if k not in SOUS_GRAPHES_TEMPLATE or k in spec['layout']}
+    
+    for trace in spec['data']:
+        _dedupliquer_customdata(trace)
+        _arrondir_tableaux(trace, precision)
+    
+    # pio.to_json utilise orjson lorsqu'il est installé (moteur "auto")
+    apres = len(pio.to_json(spec, validate=False))
+    return spec, avant, apres
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_FIGURES_EN_CACHE)
+def serialiser_figure(_section, cle, nom, empreinte, precision):
+    """Figure `nom` de la vue sous forme compacte, prête à être envoyée au navigateur
+
+    Renvoie (figure, octets avant, octets après). La figure est un objet Figure partagé, jamais
+    modifié : st.plotly_chart se contente de le copier, alors qu'il revaliderait un dict à chaque
+    rerun (et en refuserait un sans trace). Un cache de ressources évite aussi de la désérialiser.
+    """
+    spec, avant, apres = compacter_figure(construire_figure(_section, cle, nom, empreinte), precision)
+    return go.Figure(spec), avant, apres
+
+class SectionGraphique(Section):
+    """Section dont les graphiques sont construits par ses méthodes `figure_<nom>(vue)`"""
+    
+    def figure(self, nom):
+        """Renvoie la figure `nom` de la vue courante (compactée si activé) depuis le cache partagé"""
+        dashboard = self.dashboard
+        cle = dashboard.cle_vue(self.jeux)
+        if PRECISION_AFFICHAGE is None:
+            fig = construire_figure(self, cle, nom, dashboard.empreinte_donnees)
+            _marquer_construite(self.cle_figure(nom))
+            return fig
+        
+        fig, avant, apres = serialiser_figure(self, cle, nom, dashboard.empreinte_donnees,
+                                              PRECISION_AFFICHAGE)
+        _marquer_construite(self.cle_figure(nom))
+        dashboard.rapport_charge[nom] = (avant, apres)
+        return fig
+    
+    def cle_figure(self, nom):
+        """Clé de cache de la figure `nom` pour la vue courante"""
+        dashboard = self.dashboard
+        return nom, dashboard.cle_vue(self.jeux), dashboard.empreinte_donnees, PRECISION_AFFICHAGE
+    
+    def figures(self, *noms):
+        """Renvoie les figures demandées dans l'ordre, construites simultanément si activé"""
+        with _VERROU_FIGURES:
+            a_construire = [nom for nom in noms if self.cle_figure(nom) not in FIGURES_CONSTRUITES]
+        if not CONSTRUCTION_PARALLELE or len(a_construire) < 2:
+            return [self.figure(nom) for nom in noms]
+        
+        # Les threads du pool partagent le contexte de la session (cache, widgets)
+        with ThreadPoolExecutor(max_workers=min(len(noms), MAX_THREADS_FIGURES),
+                                initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as pool:
+            return list(pool.map(self.figure, noms))
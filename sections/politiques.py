@@ -0,0 +1,129 @@
+"""Onglet Politiques : timeline, efficacité des stratégies et recommandations par territoire"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from sections.graphiques import SectionGraphique
+
+# Timeline des politiques spécifiques aux DROM-COM
+POLITIQUES = [
+    {'date': '2005-03-15', 'type': 'prevention', 'titre': 'Plan alcool outre-mer', 
+     'description': 'Premier plan spécifique de prévention de l\'alcoolisme dans les DROM-COM'},
+    {'date': '2010-09-01', 'type': 'regulation', 'titre': 'Encadrement des débits de boissons', 
+     'description': 'Renforcement de la régulation de la vente d\'alcool dans les outre-mer'},
+    {'date': '2014-01-01', 'type': 'treatment', 'titre': 'Centres addictologie outre-mer', 
+     'description': 'Création de centres spécialisés dans les territoires ultramarins'},
+    {'date': '2017-06-20', 'type': 'prevention', 'titre': 'Campagne "Alcool, parlons-en"', 
+     'description': 'Campagne de prévention adaptée aux cultures locales'},
+    {'date': '2019-11-01', 'type': 'regulation', 'titre': 'Interdiction publicité proximité écoles', 
+     'description': 'Interdiction de la publicité pour l\'alcool près des établissements scolaires'},
+    {'date': '2021-03-01', 'type': 'treatment', 'titre': 'Télémédecine addictologique', 
+     'description': 'Déploiement de la téléconsultation pour les addictions'},
+    {'date': '2022-09-01', 'type': 'prevention', 'titre': 'Programme "Jeunesse sans alcool"', 
+     'description': 'Prévention ciblée sur les jeunes des outre-mer'},
+    {'date': '2023-01-01', 'type': 'regulation', 'titre': 'Renforcement contrôles alcoolémie', 
+     'description': 'Multiplication des contrôles routiers dans les territoires'},
+]
+
+
+class SectionPolitiques(SectionGraphique):
+    jeux = ('historical',)
+    
+    def afficher(self):
+        """Analyse des politiques de prévention"""
+        st.markdown('<h3 class="section-header">🏛️ POLITIQUES DE PRÉVENTION</h3>', 
+                   unsafe_allow_html=True)
+        
+        tab1, tab2, tab3 = st.tabs(["Timeline", "Efficacité", "Recommandations"])
+        fig_timeline, fig_efficacite = self.figures('timeline_politiques', 'efficacite_strategies')
+        
+        with tab1:
+            # Timeline interactive des politiques
+            st.plotly_chart(fig_timeline, use_container_width=True)
+            
+            # Légende des types de politiques
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown('<div class="policy-card policy-prevention">Prévention</div>', unsafe_allow_html=True)
+            with col2:
+                st.markdown('<div class="policy-card policy-regulation">Régulation</div>', unsafe_allow_html=True)
+            with col3:
+                st.markdown('<div class="policy-card policy-treatment">Prise en charge</div>', unsafe_allow_html=True)
+        
+        with tab2:
+            # Efficacité comparée des stratégies
+            st.subheader("Efficacité des Stratégies de Prévention")
+            
+            st.plotly_chart(fig_efficacite, use_container_width=True)
+        
+        with tab3:
+            st.subheader("Recommandations par Territoire")
+            
+            recommendations = {
+                'Guadeloupe': ['Renforcer prévention jeunes', 'Développer CSAPA', 'Contrôles renforcés'],
+                'Martinique': ['Campagne média', 'Formation professionnels', 'Prévention périnatale'],
+                'Guyane': ['Adaptation culturelle', 'Prévention communautaire', 'Renforcement soins'],
+                'La Réunion': ['Prévention scolaire', 'Dépistage systématique', 'Soins de suite'],
+                'Mayotte': ['Sensibilisation précoce', 'Formation tradipraticiens', 'Accès aux soins'],
+                'Saint-Martin': ['Régulation vente', 'Prévention touristique', 'Soins urgents'],
+                'Saint-Barthélemy': ['Prévention luxury', 'Contrôles événements', 'Soins privés'],
+                'Polynésie française': ['Prévention traditionnelle', 'Soins insulaires', 'Télémédecine'],
+                'Nouvelle-Calédonie': ['Prévention minière', 'Soins ruraux', 'Programmes workplace']
+            }
+            
+            selected_territory = st.selectbox("Sélectionnez un territoire:", list(recommendations.keys()))
+            
+            st.markdown(f"### Recommandations pour {selected_territory}")
+            for i, recommendation in enumerate(recommendations[selected_territory], 1):
+                st.write(f"{i}. {recommendation}")
+    
+    def figure_timeline_politiques(self, vue):
+        """Impact des politiques sur la consommation"""
+        policy_df = pd.DataFrame(POLITIQUES)
+        policy_df['date'] = pd.to_datetime(policy_df['date'])
+        policy_df['annee'] = policy_df['date'].dt.year
+        
+        # Fusion avec données historiques
+        merged_data = pd.merge(vue['historical'], policy_df, on='annee', how='left')
+        
+        fig = px.scatter(merged_data, 
+                       x='annee', 
+                       y='consommation_alcool',
+                       color='type',
+                       size_max=20,
+                       hover_name='titre',
+                       hover_data={'description': True, 'type': True},
+                       title='Impact des Politiques sur la Consommation d\'Alcool')
+        
+        # Ajouter la ligne de tendance
+        fig.add_trace(go.Scatter(x=vue['historical']['annee'], 
+                               y=vue['historical']['consommation_alcool'],
+                               mode='lines',
+                               name='Consommation alcool',
+                               line=dict(color='gray', width=2)))
+        
+        fig.update_layout(showlegend=True)
+        return fig
+    
+    def figure_efficacite_strategies(self, vue):
+        """Efficacité comparée des stratégies"""
+        strategies = [
+            {'strategie': 'Prévention scolaire', 'efficacite': 7.8, 'cout': 4, 'acceptabilite': 9},
+            {'strategie': 'Contrôles d\'alcoolémie', 'efficacite': 8.5, 'cout': 6, 'acceptabilite': 6},
+            {'strategie': 'Limitation publicité', 'efficacite': 6.2, 'cout': 3, 'acceptabilite': 7},
+            {'strategie': 'Augmentation des prix', 'efficacite': 8.9, 'cout': 2, 'acceptabilite': 4},
+            {'strategie': 'Dépistage précoce', 'efficacite': 7.1, 'cout': 5, 'acceptabilite': 8},
+            {'strategie': 'CSAPA spécialisés', 'efficacite': 8.2, 'cout': 7, 'acceptabilite': 8},
+        ]
+        
+        strategy_df = pd.DataFrame(strategies)
+        
+        return px.scatter(strategy_df, 
+                         x='cout', 
+                         y='efficacite',
+                         size='acceptabilite',
+                         color='strategie',
+                         hover_name='strategie',
+                         title='Efficacité vs Coût des Stratégies',
+                         size_max=30)
@@ -0,0 +1,123 @@
+"""Onglet Stratégie : objectifs 2030, plan d'action et indicateurs de suivi"""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from sections.graphiques import SectionGraphique
+
+
+class SectionStrategie(SectionGraphique):
+    
+    def afficher(self):
+        """Recommandations stratégiques"""
+        st.markdown('<h3 class="section-header">🎯 STRATÉGIE NATIONALE ALCOOL DROM-COM</h3>', 
+                   unsafe_allow_html=True)
+        
+        tab1, tab2, tab3 = st.tabs(["Objectifs 2030", "Plan d'Action", "Indicateurs"])
+        
+        with tab1:
+            st.subheader("Stratégie Nationale 2024-2030")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.markdown("""
+                ### 🎯 Réduction Consommation
+                
+                **Objectifs quantitatifs:**
+                • -20% consommation globale  
+                • -30% binge drinking  
+                • -25% dépendance alcool  
+                
+                **Cibles prioritaires:**
+                • Jeunes 15-25 ans  
+                • Femmes enceintes  
+                • Populations vulnérables  
+                """)
+            
+            with col2:
+                st.markdown("""
+                ### 🏥 Amélioration Soins
+                
+                **Couverture territoriale:**
+                • 100% CSAPA accessibles  
+                • Délais < 15 jours  
+                • Télémédecine généralisée  
+                
+                **Qualité des soins:**
+                • Formation spécifique  
+                • Prise en charge globale  
+                • Suivi à long terme  
+                """)
+            
+            with col3:
+                st.markdown("""
+                ### 📚 Renforcement Prévention
+                
+                **Éducation:**
+                • Programmes scolaires  
+                • Formation enseignants  
+                • Sensibilisation parents  
+                
+                **Communautaire:**
+                • Leaders d'opinion  
+                • Associations locales  
+                • Médias territoriaux  
+                """)
+        
+        with tab2:
+            st.subheader("Plan d'Action Prioritaire")
+            
+            roadmap = [
+                {'periode': '2024-2025', 'actions': [
+                    'Cartographie des besoins',
+                    'Formation des professionnels', 
+                    'Campagne média territoriale'
+                ]},
+                {'periode': '2026-2027', 'actions': [
+                    'Déploiement CSAPA',
+                    'Programme scolaire unifié',
+                    'Système de dépistage'
+                ]},
+                {'periode': '2028-2030', 'actions': [
+                    'Évaluation stratégique',
+                    'Adjustement des programmes',
+                    'Généralisation des bonnes pratiques'
+                ]},
+            ]
+            
+            for step in roadmap:
+                with st.expander(f"📅 {step['periode']}"):
+                    for action in step['actions']:
+                        st.write(f"• {action}")
+        
+        with tab3:
+            st.subheader("Tableau de Bord de Suivi")
+            
+            indicators = [
+                {'indicateur': 'Consommation alcool (L/pers/an)', 'cible_2025': 9.5, 'cible_2030': 8.5},
+                {'indicateur': 'Binge drinking (%)', 'cible_2025': 28, 'cible_2030': 25},
+                {'indicateur': 'Âge 1ère ivresse (ans)', 'cible_2025': 12.5, 'cible_2030': 13.0},
+                {'indicateur': 'Décès liés à l\'alcool', 'cible_2025': 950, 'cible_2030': 850},
+                {'indicateur': 'Couverture CSAPA (%)', 'cible_2025': 85, 'cible_2030': 95},
+            ]
+            
+            indicators_df = pd.DataFrame(indicators)
+            st.dataframe(indicators_df, use_container_width=True)
+            
+            # Graphique de projection
+            if self.dashboard.etat_vue['projections']:
+                st.plotly_chart(self.figure('projection'), use_container_width=True)
+    
+    def figure_projection(self, vue):
+        """Projection de la consommation"""
+        years = list(range(2020, 2031))
+        consommation_projection = [11.2, 11.0, 10.8, 10.6, 10.2, 9.8, 9.5, 9.2, 8.9, 8.7, 8.5]
+        
+        fig = px.line(x=years, y=consommation_projection,
+                     title='Projection de la Consommation d\'Alcool 2020-2030',
+                     markers=True)
+        fig.add_hrect(y0=0, y1=8.5, line_width=0, fillcolor="green", opacity=0.2,
+                     annotation_text="Objectif 2030")
+        fig.update_layout(yaxis_title="Consommation (L/pers/an)", xaxis_title="Année")
+        return fig
@@ -0,0 +1,67 @@
+"""Onglet Synthèse : situation, leviers d'action et recommandations urgentes"""
+import streamlit as st
+
+from sections import Section
+
+
+class SectionSynthese(Section):
+    
+    def afficher(self):
+        """Synthèse stratégique"""
+        st.markdown("## 💡 SYNTHÈSE STRATÉGIQUE")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            ### ⚠️ SITUATION ALARMANTE
+            
+            **Problématiques majeures:**
+            • Consommation supérieure à la métropole  
+            • Binge drinking très élevé chez les jeunes  
+            • Initiation précoce préoccupante  
+            • Mortalité liée significative  
+            
+            **Facteurs aggravants:**
+            • Traditions culturelles ancrées  
+            • Accessibilité importante  
+            • Offre de soins insuffisante  
+            • Prévention inadaptée  
+            """)
+        
+        with col2:
+            st.markdown("""
+            ### ✅ LEVIERS D'ACTION
+            
+            **Atouts territoriaux:**
+            • Structures communautaires fortes  
+            • Leadership local engagé  
+            • Expériences pilotes prometteuses  
+            
+            **Opportunités:**
+            • Plans nationaux spécifiques  
+            • Financements dédiés  
+            • Coopération régionale  
+            • Innovation numérique  
+            """)
+        
+        st.markdown("""
+        ### 🚨 RECOMMANDATIONS URGENTES
+        
+        **Priorité 1 - Prévention ciblée:**
+        1. Programmes scolaires adaptés aux cultures locales  
+        2. Campagnes média avec leaders d'opinion territoriaux  
+        3. Prévention communautaire par les pairs  
+        
+        **Priorité 2 - Soins accessibles:**
+        1. Renforcement des CSAPA dans tous les territoires  
+        2. Déploiement de la télémédecine addictologique  
+        3. Formation des professionnels de santé de première ligne  
+        
+        **Priorité 3 - Régulation adaptée:**
+        1. Contrôles renforcés de la vente aux mineurs  
+        2. Encadrement de la publicité proximité écoles  
+        3. Politique prix cohérente entre territoires  
+        
+        **Échéance: Plan d'action opérationnel pour 2024**
+        """)
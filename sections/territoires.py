@@ -0,0 +1,162 @@
+"""Onglet Territoires : cartographie et comparaison des territoires"""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from sections.graphiques import SectionGraphique
+
+
+class SectionTerritoires(SectionGraphique):
+    jeux = ('territorial',)
+    
+    def afficher(self):
+        """Analyse des disparités territoriales"""
+        st.markdown('<h3 class="section-header">🗺️ DISPARITÉS TERRITORIALES</h3>', 
+                   unsafe_allow_html=True)
+        
+        tab1, tab2, tab3 = st.tabs(["Cartographie", "Comparaisons", "Facteurs Contextuels"])
+        fig_carte, fig_consommation, fig_binge = self.figures(
+            'carte', 'classement_consommation', 'classement_binge')
+        
+        with tab1:
+            # Carte des territoires
+            st.subheader("Consommation d'Alcool par Territoire")
+            st.plotly_chart(fig_carte, use_container_width=True)
+        
+        with tab2:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.plotly_chart(fig_consommation, use_container_width=True)
+            
+            with col2:
+                st.plotly_chart(fig_binge, use_container_width=True)
+        
+        with tab3:
+            # Facteurs contextuels spécifiques
+            st.subheader("Facteurs Influençant la Consommation")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("""
+                ### 🏝️ Facteurs Socio-culturels
+                
+                **Traditions et rituels:**
+                • Consommation cérémonielle  
+                • Importance sociale  
+                • Transmission générationnelle  
+                
+                **Normes sociales:**
+                • Tolérance élevée  
+                • Stigmatisation faible  
+                • Pression des pairs  
+                
+                **Contexte économique:**
+                • Prix relativement bas  
+                • Accessibilité importante  
+                • Marketing agressif  
+                """)
+            
+            with col2:
+                st.markdown("""
+                ### 🏥 Facteurs Structurels
+                
+                **Offre de soins:**
+                • Disparités territoriales  
+                • Accès aux CSAPA  
+                • Médecins addictologues  
+                
+                **Prévention:**
+                • Campagnes adaptées  
+                • Éducation scolaire  
+                • Dépistage précoce  
+                
+                **Régulation:**
+                • Application des lois  
+                • Contrôles de vente  
+                • Prévention commerciale  
+                """)
+    
+    def figure_carte(self, vue):
+        """Carte de la consommation par territoire"""
+        # Coordonnées approximatives des territoires
+        territories_coords = {
+            'Guadeloupe': {'lat': 16.265, 'lon': -61.551, 'consommation': 12.8},
+            'Martinique': {'lat': 14.641, 'lon': -61.024, 'consommation': 11.5},
+            'Guyane': {'lat': 3.933, 'lon': -53.125, 'consommation': 14.2},
+            'La Réunion': {'lat': -21.115, 'lon': 55.536, 'consommation': 13.1},
+            'Mayotte': {'lat': -12.827, 'lon': 45.166, 'consommation': 9.8},
+            'Saint-Martin': {'lat': 18.070, 'lon': -63.050, 'consommation': 15.6},
+            'Saint-Barthélemy': {'lat': 17.900, 'lon': -62.850, 'consommation': 16.8},
+            'Polynésie française': {'lat': -17.679, 'lon': -149.407, 'consommation': 10.9},
+            'Nouvelle-Calédonie': {'lat': -21.300, 'lon': 165.300, 'consommation': 11.3}
+        }
+        
+        # Créer un DataFrame avec les coordonnées des territoires sélectionnés
+        coords_data = []
+        selection = set(vue['territorial']['territoire'])
+        for territory, info in territories_coords.items():
+            if territory not in selection:
+                continue
+            coords_data.append({
+                'territoire': territory,
+                'lat': info['lat'],
+                'lon': info['lon'],
+                'consommation_alcool': info['consommation']
+            })
+        
+        coords_df = pd.DataFrame(coords_data, columns=['territoire', 'lat', 'lon', 'consommation_alcool'])
+        
+        # Créer une carte scatter_geo
+        fig = px.scatter_geo(coords_df,
+                            lat='lat',
+                            lon='lon',
+                            color='consommation_alcool',
+                            size='consommation_alcool',
+                            hover_name='territoire',
+                            hover_data={'consommation_alcool': True},
+                            title='Consommation d\'Alcool par Territoire (litres/pers/an) - 2023',
+                            color_continuous_scale='RdYlGn_r',
+                            size_max=20,
+                            projection='natural earth')
+        
+        # Configuration de la carte
+        fig.update_geos(
+            visible=True,
+            showcountries=True,
+            countrycolor="black",
+            showsubunits=True,
+            subunitcolor="blue",
+            landcolor="lightgray",
+            oceancolor="lightblue",
+            bgcolor="white"
+        )
+        
+        fig.update_layout(
+            height=600,
+            geo=dict(
+                bgcolor='rgba(255,255,255,0.1)'
+            )
+        )
+        return fig
+    
+    def figure_classement_consommation(self, vue):
+        """Classement par consommation"""
+        return px.bar(vue['territorial'].sort_values('consommation_2023'), 
+                     x='consommation_2023', 
+                     y='territoire',
+                     orientation='h',
+                     title='Consommation d\'Alcool par Territoire (L/pers/an)',
+                     color='consommation_2023',
+                     color_continuous_scale='RdYlGn_r')
+    
+    def figure_classement_binge(self, vue):
+        """Classement par binge drinking"""
+        return px.bar(vue['territorial'].sort_values('binge_drinking'), 
+                     x='binge_drinking', 
+                     y='territoire',
+                     orientation='h',
+                     title='Binge Drinking par Territoire (%)',
+                     color='binge_drinking',
+                     color_continuous_scale='RdYlGn_r')
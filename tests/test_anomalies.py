@@ -0,0 +1,106 @@
+"""Détection incrémentale de pics hebdomadaires"""
+import numpy as np
+import pandas as pd
+
+from anomalies import DetecteurAnomalies
+
+SEMAINES = pd.date_range('2021-01-04', periods=104, freq='W-MON')
+
+
+def serie(alea, base=40.0, semaines=SEMAINES):
+    """Comptages de Poisson autour d'une base avec une saisonnalité annuelle"""
+    saison = 1 + 0.2 * np.sin(2 * np.pi * np.arange(len(semaines)) / 52)
+    return alea.poisson(base * saison).astype(float)
+
+
+def test_rodage_sans_alerte():
+    detecteur = DetecteurAnomalies(rodage=8)
+    valeurs = [10, 10, 10, 500, 10, 10]
+    alertes = [detecteur.observer('Guyane', 'deces_alcool', semaine, valeur)
+               for semaine, valeur in zip(SEMAINES, valeurs)]
+    assert alertes == [None] * len(valeurs)
+
+
+def test_pic_signale_apres_rodage():
+    alea = np.random.default_rng(0)
+    detecteur = DetecteurAnomalies()
+    valeurs = serie(alea)
+    valeurs[80] *= 3
+    alertes = [detecteur.observer('Mayotte', 'hospitalisations', semaine, valeur)
+               for semaine, valeur in zip(SEMAINES, valeurs)]
+    levees = [i for i, alerte in enumerate(alertes) if alerte is not None]
+    assert levees == [80]
+    assert alertes[80]['territoire'] == 'Mayotte'
+    assert alertes[80]['z'] > detecteur.seuil
+    assert detecteur.alertes_recentes() == [alertes[80]]
+
+
+def test_baisse_non_signalee():
+    alea = np.random.default_rng(1)
+    detecteur = DetecteurAnomalies()
+    valeurs = serie(alea)
+    valeurs[80] = 0
+    assert not any(detecteur.observer('Guyane', 'accidents_route', semaine, valeur)
+                   for semaine, valeur in zip(SEMAINES, valeurs))
+
+
+def test_semaine_deja_vue_ou_anterieure_ignoree():
+    detecteur = DetecteurAnomalies(rodage=1)
+    for semaine in SEMAINES[:10]:
+        detecteur.observer('Guyane', 'deces_alcool', semaine, 10)
+    niveau = detecteur.niveau[0]
+
+    assert detecteur.observer('Guyane', 'deces_alcool', SEMAINES[9], 1000) is None
+    assert detecteur.observer('Guyane', 'deces_alcool', SEMAINES[3], 1000) is None
+    assert detecteur.observations == 10
+    assert detecteur.niveau[0] == niveau
+    assert detecteur.alertes_recentes() == []
+
+
+def test_semaine_53_rangee_avec_la_semaine_52():
+    detecteur = DetecteurAnomalies(rodage=1)
+    semaines = pd.date_range('2020-12-14', periods=3, freq='W-MON')  # semaines ISO 51, 52 et 53
+    assert [s.isocalendar().week for s in semaines] == [51, 52, 53]
+    for semaine, valeur in zip(semaines, [10, 10, 30]):
+        detecteur.observer('Guyane', 'deces_alcool', semaine, valeur)
+    assert detecteur.saison[0, 0] == 0
+    assert detecteur.saison[0, 51] != 0
+
+
+def test_observer_lot_format_large():
+    alea = np.random.default_rng(2)
+    lot = pd.DataFrame({
+        'territoire': 'La Réunion',
+        'semaine': SEMAINES,
+        'deces_alcool': serie(alea),
+        'violences_familiales': serie(alea, base=25.0),
+    })
+    lot.loc[90, 'violences_familiales'] *= 3
+    detecteur = DetecteurAnomalies()
+    alertes = detecteur.observer_lot(lot.sample(frac=1, random_state=0))
+    assert alertes[['indicateur', 'semaine']].values.tolist() == [
+        ['violences_familiales', SEMAINES[90].date()]]
+    assert len(detecteur.index) == 2
+    assert detecteur.observations == 2 * len(SEMAINES)
+
+
+def test_detection_sur_series_synthetiques():
+    # 45 séries (9 territoires x 5 indicateurs) sur 3 ans, avec des pics injectés de x2 à x3
+    alea = np.random.default_rng(42)
+    semaines = pd.date_range('2021-01-04', periods=156, freq='W-MON')
+    detecteur = DetecteurAnomalies()
+    injectes, vrais, faux = 0, 0, 0
+    for numero in range(45):
+        valeurs = serie(alea, base=alea.uniform(20, 200), semaines=semaines)
+        pics = set(alea.choice(np.arange(20, 156), size=alea.integers(0, 3), replace=False).tolist())
+        for i in pics:
+            valeurs[i] *= alea.uniform(2, 3)
+        injectes += len(pics)
+        for i, (semaine, valeur) in enumerate(zip(semaines, valeurs)):
+            if detecteur.observer(f'serie {numero}', 'deces_alcool', semaine, valeur) is not None:
+                vrais += i in pics
+                faux += i not in pics
+    # Graine 42 : 38 pics détectés sur 41, 1 fausse alerte sur 7 020 observations
+    assert vrais >= 0.8 * injectes
+    assert faux <= 0.001 * 45 * len(semaines)
+    assert detecteur.taille_etat() < 64 * 1024
@@ -0,0 +1,89 @@
+"""Rendu de bout en bout du dashboard (streamlit.testing)"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from referentiels import ONGLETS
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard.py')
+
+
+def rendre(**parametres):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.query_params.update(parametres)
+    return at.run()
+
+
+@pytest.mark.parametrize('onglet', ONGLETS)
+def test_onglet_rendu_sans_erreur(onglet):
+    assert not rendre(onglet=onglet).exception
+
+
+@pytest.mark.parametrize('onglet', ONGLETS)
+def test_periode_sans_donnees(onglet):
+    # Les séries santé et sociales commencent en 2010 : leurs figures n'ont aucune trace
+    assert not rendre(onglet=onglet, debut='2005', fin='2008').exception
+
+
+def app_avec_lot_2009():
+    import pandas as pd
+    from Dashboard import AlcoholDROMCOMDashboard, magasin_donnees
+
+    dashboard = AlcoholDROMCOMDashboard()
+    lot = pd.DataFrame({'annee': [2009], 'deces_alcool': [1260], 'hospitalisations': [18600],
+                        'cancers_digesifs': [410], 'cirrhoses': [690], 'accidents_route': [290]})
+    try:
+        dashboard.ingest_batch('health', lot)
+        dashboard.display_key_metrics()
+    finally:
+        magasin_donnees.clear()
+
+
+def test_metriques_apres_integration_d_un_lot():
+    # Le lot 2009 décale l'index des données santé : la métrique reste celle de 2023
+    at = AppTest.from_function(app_avec_lot_2009, default_timeout=60).run()
+    assert not at.exception
+    assert at.metric[2].label == "Décès liés à l'alcool"
+    assert at.metric[2].value == "990"
+
+
+@pytest.fixture
+def caches_vides():
+    # Le détecteur et le magasin sont partagés par le processus : chaque test repart de zéro
+    st.cache_resource.clear()
+    yield
+    st.cache_resource.clear()
+
+
+def test_comptages_hebdomadaires_importes_levent_une_alerte(caches_vides):
+    alea = np.random.default_rng(3)
+    semaines = pd.date_range('2024-01-01', periods=30, freq='W-MON')
+    deces = alea.poisson(40, len(semaines)).astype(float)
+    deces[-1] *= 3
+    lot = pd.DataFrame({'territoire': 'La Réunion', 'semaine': semaines.date, 'deces_alcool': deces})
+
+    at = rendre(onglet="🚨 Alertes")
+    assert at.info[0].value.startswith("Aucune alerte")
+    at.selectbox(key='lot_jeu').set_value('comptages hebdomadaires')
+    at.file_uploader(key='lot_fichier').upload('comptages.csv', lot.to_csv(index=False).encode(), 'text/csv')
+    at.run()
+    at.button(key='lot_integrer').click().run()
+
+    assert not at.exception
+    assert at.success[0].value == "30 lignes observées, 1 alertes levées"
+    alertes = at.dataframe[0].value
+    assert alertes[['territoire', 'indicateur']].values.tolist() == [['La Réunion', 'deces_alcool']]
+    assert alertes['semaine'].tolist() == [semaines[-1].date()]
+
+
+def test_comptages_sans_colonne_semaine_signales(caches_vides):
+    at = rendre()
+    at.selectbox(key='lot_jeu').set_value('comptages hebdomadaires')
+    at.file_uploader(key='lot_fichier').upload('comptages.csv', b'territoire,deces_alcool\nGuyane,3\n', 'text/csv')
+    at.run()
+    at.button(key='lot_integrer').click().run()
+    assert at.error[0].value == "Comptages inexploitables : colonnes manquantes : semaine"
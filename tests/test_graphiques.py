@@ -0,0 +1,91 @@
+"""Compaction et construction des figures envoyées au navigateur"""
+import threading
+import time
+
+import plotly.express as px
+import plotly.graph_objects as go
+import pandas as pd
+
+from sections import graphiques
+from sections.graphiques import SectionGraphique, compacter_figure
+
+
+def test_colonne_constante_ecrite_dans_le_hovertemplate():
+    df = pd.DataFrame({'x': [1, 2, 3, 4], 'y': [1.23456, 2.5, 3.0, 4.0],
+                       'type': ['a', 'a', 'b', 'b'], 'description': ['p', 'q', 'r', 's']})
+    fig = px.scatter(df, x='x', y='y', color='type', hover_data={'description': True, 'type': True})
+    spec, avant, apres = compacter_figure(fig)
+
+    trace = spec['data'][0]
+    assert 'type=a' in trace['hovertemplate']
+    assert '%{customdata[0]}' in trace['hovertemplate']
+    assert [ligne[0] for ligne in trace['customdata']] == ['p', 'q']
+    assert apres < avant
+
+
+def test_colonne_non_affichee_retiree():
+    df = pd.DataFrame({'lat': [1.0, 2.0], 'lon': [3.0, 4.0], 'valeur': [5.5, 6.5]})
+    fig = px.scatter_geo(df, lat='lat', lon='lon', color='valeur', hover_data={'valeur': True})
+    spec, _, _ = compacter_figure(fig)
+    assert 'customdata' not in spec['data'][0]
+
+
+def test_arrondi_a_la_precision_demandee():
+    fig = px.line(x=[2000, 2001], y=[1.23456, 2.98765])
+    spec, _, _ = compacter_figure(fig, precision=2)
+    assert spec['data'][0]['y'] == [1.23, 2.99]
+
+
+class DashboardFactice:
+    """Dashboard réduit à ce dont SectionGraphique a besoin"""
+    empreinte_donnees = 'test-pool'
+
+    def __init__(self):
+        self.rapport_charge = {}
+
+    def cle_vue(self, jeux):
+        return ()
+
+    def vue(self, cle):
+        return {}
+
+
+class SectionFactice(SectionGraphique):
+    threads = set()
+
+    def afficher(self):
+        pass
+
+    def _figure(self, numero):
+        # Les premières figures demandées finissent les dernières
+        time.sleep(0.02 * (4 - numero))
+        self.threads.add(threading.current_thread().name)
+        return go.Figure(go.Bar(x=[numero], y=[numero]))
+
+    def figure_a(self, vue):
+        return self._figure(0)
+
+    def figure_b(self, vue):
+        return self._figure(1)
+
+    def figure_c(self, vue):
+        return self._figure(2)
+
+    def figure_d(self, vue):
+        return self._figure(3)
+
+
+def test_figures_du_pool_dans_l_ordre_demande(monkeypatch):
+    monkeypatch.setattr(graphiques, 'CONSTRUCTION_PARALLELE', True)
+    section = SectionFactice(DashboardFactice())
+    figures = section.figures('c', 'a', 'd', 'b')
+    assert all(isinstance(fig, go.Figure) for fig in figures)
+    assert [fig.data[0].x[0] for fig in figures] == [2, 0, 3, 1]
+    assert threading.current_thread().name not in section.threads
+    assert set(section.dashboard.rapport_charge) == {'a', 'b', 'c', 'd'}
+
+
+def test_trace_vide_avec_customdata():
+    df = pd.DataFrame({'x': [], 'y': [], 'd': []})
+    spec, _, _ = compacter_figure(px.scatter(df, x='x', y='y', hover_data={'d': True}))
+    assert len(spec['data']) == 1
@@ -0,0 +1,120 @@
+"""Validation vectorisée des lots externes"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from referentiels import ANNEE_FIN
+from validation import CLE_MANQUANTE, integrer_lot, valider_lot
+
+
+def sante(annees, deces=1000):
+    return pd.DataFrame({
+        'annee': annees,
+        'deces_alcool': deces,
+        'hospitalisations': 18000,
+        'cancers_digesifs': 400,
+        'cirrhoses': 600,
+        'accidents_route': 250,
+    })
+
+
+def territoires(noms, binge=30.0):
+    return pd.DataFrame({
+        'territoire': noms,
+        'consommation_2023': 12.0,
+        'binge_drinking': binge,
+        'dependance_alcool': 9.0,
+        'ivresse_occasionnelle': 44.0,
+        'mortalite_alcool': 28.0,
+        'prise_charge_addicto': 70.0,
+    })
+
+
+@pytest.fixture
+def reference():
+    return sante(range(2010, 2024))
+
+
+def anomalies(rapport, controle):
+    return rapport['anomalies'][rapport['anomalies']['controle'] == controle]
+
+
+def test_lot_valide_accepte_et_integre(reference):
+    rapport = valider_lot(sante([2024]), 'health', reference=reference)
+    assert rapport['partitions'].to_dict() == {'2024': 'acceptee'}
+    assert rapport['anomalies'].empty
+    fusion = integrer_lot(reference, rapport['acceptees'], 'health')
+    assert fusion['annee'].tolist() == list(range(2010, 2025))
+
+
+def test_colonne_manquante_rejette_tout_le_lot(reference):
+    rapport = valider_lot(sante([2024]).drop(columns='cirrhoses'), 'health', reference=reference)
+    assert len(rapport['rejetees']) == 1
+    assert anomalies(rapport, 'colonne_manquante')['colonne'].tolist() == ['cirrhoses']
+
+
+def test_colonne_inattendue_signalee_sans_rejet(reference):
+    rapport = valider_lot(sante([2024]).assign(source='x'), 'health', reference=reference)
+    assert rapport['partitions'].to_dict() == {'2024': 'acceptee'}
+    assert anomalies(rapport, 'colonne_inattendue')['gravite'].tolist() == ['info']
+
+
+def test_type_invalide_rejette_la_partition(reference):
+    lot = sante([2024, 2025]).astype({'deces_alcool': object})
+    lot.loc[1, 'deces_alcool'] = 'beaucoup'
+    rapport = valider_lot(lot, 'health', reference=reference)
+    assert rapport['partitions'].to_dict() == {'2024': 'acceptee', '2025': 'rejetee'}
+    assert anomalies(rapport, 'type_invalide')['partition'].tolist() == ['2025']
+
+
+def test_territoire_inconnu_rejete():
+    rapport = valider_lot(territoires(['Guyane', 'Atlantide']), 'territorial')
+    assert rapport['partitions'].to_dict() == {'Guyane': 'acceptee', 'Atlantide': 'rejetee'}
+    assert anomalies(rapport, 'territoire_inconnu')['partition'].tolist() == ['Atlantide']
+
+
+def test_taux_hors_bornes_rejete():
+    rapport = valider_lot(territoires(['Guyane', 'Mayotte'], binge=[30.0, 130.0]), 'territorial')
+    assert rapport['partitions']['Mayotte'] == 'rejetee'
+    assert anomalies(rapport, 'taux_hors_bornes')['colonne'].tolist() == ['binge_drinking']
+
+
+def test_saut_annuel_par_rapport_aux_donnees_chargees_en_quarantaine(reference):
+    rapport = valider_lot(sante([2024], deces=5000), 'health', reference=reference)
+    assert rapport['partitions'].to_dict() == {'2024': 'quarantaine'}
+    assert anomalies(rapport, 'saut_annuel')['colonne'].tolist() == ['deces_alcool']
+    assert rapport['acceptees'].empty
+
+
+def test_annee_posterieure_a_la_periode_rejetee(reference):
+    rapport = valider_lot(sante([2024, ANNEE_FIN + 1]), 'health', reference=reference)
+    assert rapport['partitions'][str(ANNEE_FIN + 1)] == 'rejetee'
+    assert anomalies(rapport, 'annee_hors_periode')['partition'].tolist() == [str(ANNEE_FIN + 1)]
+
+
+def test_annee_manquante_en_quarantaine(reference):
+    rapport = valider_lot(sante([2025]), 'health', reference=reference)
+    assert rapport['partitions'].to_dict() == {'2025': 'quarantaine'}
+    assert not anomalies(rapport, 'annee_manquante').empty
+
+
+def test_lot_vide(reference):
+    rapport = valider_lot(sante([]).iloc[0:0], 'health', reference=reference)
+    assert rapport['lignes'] == 0
+    assert rapport['partitions'].empty
+    assert rapport['acceptees'].empty
+    assert integrer_lot(reference, rapport['acceptees'], 'health') is reference
+
+
+def test_annee_absente_signalee_et_autres_cles_entieres(reference):
+    rapport = valider_lot(sante([2024, np.nan]), 'health', reference=reference)
+    assert rapport['partitions'].to_dict() == {'2024': 'acceptee', CLE_MANQUANTE: 'rejetee'}
+    manquantes = anomalies(rapport, 'valeur_manquante')
+    assert manquantes['partition'].tolist() == [CLE_MANQUANTE]
+    assert manquantes['colonne'].tolist() == ['annee']
+
+
+def test_territoire_absent_signale():
+    rapport = valider_lot(territoires(['Guyane', None]), 'territorial')
+    assert rapport['partitions'][CLE_MANQUANTE] == 'rejetee'
+    assert anomalies(rapport, 'valeur_manquante')['partition'].tolist() == [CLE_MANQUANTE]
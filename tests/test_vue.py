@@ -0,0 +1,67 @@
+"""État canonique de la vue, permalien et clés de cache par jeu de données"""
+from urllib.parse import parse_qs
+
+from Dashboard import ETAT_PAR_DEFAUT, cle_jeu, normaliser_etat, parametres_url
+from referentiels import ANNEE_FIN, ANNEES, ONGLETS
+from test_dashboard import rendre
+
+
+def test_annees_bornees_et_remises_dans_l_ordre():
+    etat = normaliser_etat({'debut': ANNEES[-1] + 5, 'fin': ANNEES[0] - 5})
+    assert (etat['debut'], etat['fin']) == (ANNEES[0], ANNEES[-1])
+    etat = normaliser_etat({'debut': '2018', 'fin': 2012})
+    assert (etat['debut'], etat['fin']) == (2012, 2018)
+
+
+def test_annees_integrables_selectionnables():
+    # La validation accepte les années jusqu'à ANNEE_FIN : la vue doit pouvoir les afficher
+    assert ANNEES[-1] == ANNEE_FIN
+    assert normaliser_etat({'debut': 2024, 'fin': ANNEE_FIN})['fin'] == ANNEE_FIN
+
+
+def test_annee_illisible_remplacee_par_le_defaut():
+    etat = normaliser_etat({'debut': 'abc', 'fin': None})
+    assert (etat['debut'], etat['fin']) == (ETAT_PAR_DEFAUT['debut'], ETAT_PAR_DEFAUT['fin'])
+
+
+def test_listes_dans_l_ordre_canonique_sans_doublon():
+    etat = normaliser_etat({'territoires': ['Mayotte', 'Guadeloupe', 'Mayotte', 'Atlantide'],
+                            'focus': ['Territoires', 'Santé']})
+    assert etat['territoires'] == ['Guadeloupe', 'Mayotte']
+    assert etat['focus'] == ['Santé', 'Territoires']
+    assert normaliser_etat(etat) == etat
+
+
+def test_onglet_inconnu_remplace_par_le_premier():
+    assert normaliser_etat({'onglet': 'Inexistant'})['onglet'] == ONGLETS[0]
+    assert normaliser_etat({'onglet': ONGLETS[2]})['onglet'] == ONGLETS[2]
+
+
+def test_parametres_au_format_des_widgets():
+    parametres = parse_qs(parametres_url({'territoires': ['Mayotte', 'Guyane'], 'projections': False}))
+    assert parametres['territoires'] == ['Guyane', 'Mayotte']
+    assert parametres['projections'] == ['false']
+    assert parametres['onglet'] == [ONGLETS[0]]
+
+
+def test_cle_jeu_ne_retient_que_l_etat_utile():
+    etat = normaliser_etat({'debut': 2005, 'fin': 2010, 'territoires': ['Guyane']})
+    autre = dict(etat, focus=['Social'], projections=False, onglet=ONGLETS[1])
+    assert cle_jeu('territorial', etat) == ('Guyane',)
+    assert cle_jeu('health', etat) == (2005, 2010)
+    for jeu in ('historical', 'territorial', 'health', 'social'):
+        assert cle_jeu(jeu, autre) == cle_jeu(jeu, etat)
+
+
+def test_permalien_restaure_la_vue():
+    etat = normaliser_etat({'debut': 2012, 'fin': 2018, 'territoires': ['Mayotte', 'Guyane'],
+                            'focus': ['Social', 'Santé'], 'projections': False, 'onglet': ONGLETS[3]})
+    url = parametres_url(etat)
+    at = rendre(**parse_qs(url))
+    assert not at.exception
+    assert at.selectbox(key='debut').value == 2012
+    assert at.selectbox(key='fin').value == 2018
+    assert at.multiselect(key='territoires').value == ['Guyane', 'Mayotte']
+    assert at.multiselect(key='focus').value == ['Santé', 'Social']
+    assert at.checkbox(key='projections').value is False
+    assert at.sidebar.caption[0].value == f"🔗 Vue partageable : ?{url}"
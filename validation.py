@@ -0,0 +1,249 @@
+"""Validation vectorisée des lots de données externes avant leur intégration au dashboard
+
+Chaque contrôle est une opération sur colonnes entières (aucune boucle par ligne) qui
+produit un masque des lignes fautives. Les masques sont ensuite agrégés par partition
+(territoire, ou année pour les séries agrégées) : une partition avec une erreur est
+rejetée, une partition avec une alerte est mise en quarantaine, les autres sont acceptées.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from referentiels import ANNEE_DEBUT, ANNEE_FIN, TERRITOIRES
+
+# Colonnes attendues par jeu de données (mêmes noms que les initialize_* du dashboard)
+SCHEMAS = {
+    'historical': {
+        'annee': 'int',
+        'consommation_alcool': 'float',
+        'binge_drinking': 'float',
+        'dependance_alcool': 'float',
+        'age_premiere_ivresse': 'float',
+    },
+    'territorial': {
+        'territoire': 'str',
+        'consommation_2023': 'float',
+        'binge_drinking': 'float',
+        'dependance_alcool': 'float',
+        'ivresse_occasionnelle': 'float',
+        'mortalite_alcool': 'float',
+        'prise_charge_addicto': 'float',
+    },
+    'health': {
+        'annee': 'int',
+        'deces_alcool': 'int',
+        'hospitalisations': 'int',
+        'cancers_digesifs': 'int',
+        'cirrhoses': 'int',
+        'accidents_route': 'int',
+    },
+    'social': {
+        'annee': 'int',
+        'violences_familiales': 'int',
+        'arrestations_ivresse': 'int',
+        'absenteisme_travail': 'float',
+        'problemes_scolaires': 'float',
+    },
+}
+
+# Colonnes exprimées en pourcentage de la population
+COLONNES_TAUX = [
+    'binge_drinking', 'prise_charge_addicto', 'dependance_alcool',
+    'ivresse_occasionnelle', 'absenteisme_travail', 'problemes_scolaires'
+]
+
+# Variation relative d'une année sur l'autre au-delà de laquelle une valeur est suspecte
+SEUIL_SAUT = 0.5
+
+# Partition des lignes dont la clé (territoire ou année) est absente
+CLE_MANQUANTE = '<manquant>'
+
+
+def cles_serie(jeu):
+    """Colonnes identifiant une ligne (et une série temporelle) du jeu de données"""
+    schema = SCHEMAS[jeu]
+    return [cle for cle in ('territoire', 'annee') if cle in schema]
+
+
+def colonne_partition(jeu):
+    """Colonne selon laquelle les lots du jeu sont acceptés ou rejetés"""
+    return 'territoire' if 'territoire' in SCHEMAS[jeu] else 'annee'
+
+
+def cles_partition(lot, jeu):
+    """Clé de partition de chaque ligne, en texte (année sans décimale, CLE_MANQUANTE si absente)
+
+    Seules les valeurs distinctes sont converties : le coût ne dépend pas du nombre de lignes.
+    """
+    colonne = colonne_partition(jeu)
+    codes, valeurs = pd.factorize(lot[colonne])
+    valeurs = pd.Series(valeurs, dtype=object)
+    if colonne == 'annee':
+        # Une colonne d'années contenant des NaN est lue en flottants : 2024.0 redevient 2024
+        nombres = pd.to_numeric(valeurs, errors='coerce')
+        entiers = nombres.notna() & (nombres == np.floor(nombres))
+        valeurs[entiers] = nombres[entiers].astype('int64')
+    libelles = np.append(valeurs.astype(str).to_numpy(dtype=object), CLE_MANQUANTE)
+    # factorize code les valeurs absentes -1, soit le dernier libellé
+    return pd.Series(libelles[codes], index=lot.index)
+
+
+def _convertir(lot, schema):
+    """Convertit les colonnes numériques ; renvoie les données typées et les contrôles de type"""
+    donnees = {}
+    masques = []
+    for colonne, type_ in schema.items():
+        brut = lot[colonne]
+        masques.append(('valeur_manquante', 'erreur', colonne, brut.isna()))
+        if type_ == 'str':
+            donnees[colonne] = brut
+            continue
+        valeurs = pd.to_numeric(brut, errors='coerce')
+        invalides = valeurs.isna() & brut.notna()
+        if type_ == 'int':
+            invalides |= valeurs.notna() & (valeurs != np.floor(valeurs))
+        masques.append(('type_invalide', 'erreur', colonne, invalides))
+        donnees[colonne] = valeurs
+    return pd.DataFrame(donnees, index=lot.index), masques
+
+
+def _controles_series(donnees, jeu, reference, seuil_saut):
+    """Continuité des années et sauts annuels, en prolongeant les séries déjà chargées"""
+    schema = SCHEMAS[jeu]
+    cles = cles_serie(jeu)
+    groupes = [cle for cle in cles if cle != 'annee']
+    annees = donnees['annee']
+
+    masques = [
+        ('annee_hors_periode', 'erreur', 'annee',
+         annees.notna() & ~annees.between(ANNEE_DEBUT, ANNEE_FIN)),
+        ('annee_dupliquee', 'erreur', 'annee', donnees.duplicated(cles, keep=False)),
+    ]
+
+    # Les lignes de référence dont la clé n'est pas remplacée par le lot servent de contexte
+    contexte = donnees.iloc[0:0]
+    if reference is not None and not reference.empty:
+        contexte = reference[list(schema)]
+        remplacees = pd.MultiIndex.from_frame(contexte[cles]).isin(pd.MultiIndex.from_frame(donnees[cles]))
+        contexte = contexte[~remplacees]
+
+    ordonnees = pd.concat({'reference': contexte, 'lot': donnees}).sort_values(cles)
+    series = ordonnees.groupby(groupes, sort=False) if groupes else ordonnees
+
+    def dans_lot(masque):
+        return masque.xs('lot', level=0).reindex(donnees.index, fill_value=False)
+
+    masques.append(('annee_manquante', 'alerte', 'annee', dans_lot(series['annee'].diff() > 1)))
+
+    for colonne, type_ in schema.items():
+        if colonne == 'annee' or type_ == 'str':
+            continue
+        precedent = series[colonne].shift()
+        saut = (ordonnees[colonne] - precedent).abs() > seuil_saut * precedent.abs()
+        masques.append(('saut_annuel', 'alerte', colonne, dans_lot(saut)))
+
+    return masques
+
+
+def valider_lot(lot, jeu, reference=None, seuil_saut=SEUIL_SAUT):
+    """Valide un lot pour le jeu `jeu` et le répartit en partitions acceptées, en quarantaine ou rejetées
+
+    `reference` contient les données déjà chargées : elle prolonge les séries pour les contrôles
+    de continuité et de saut annuel, mais n'est jamais modifiée ni bloquée par un lot invalide.
+    """
+    debut = time.perf_counter()
+    schema = SCHEMAS[jeu]
+    lot = lot.reset_index(drop=True)
+    anomalies = []
+
+    manquantes = [colonne for colonne in schema if colonne not in lot.columns]
+    inattendues = [colonne for colonne in lot.columns if colonne not in schema]
+    if inattendues:
+        anomalies.append({'controle': 'colonne_inattendue', 'gravite': 'info',
+                          'colonne': ', '.join(map(str, inattendues)), 'partition': '*',
+                          'lignes': len(lot), 'exemple': None})
+
+    if manquantes:
+        # Sans le schéma complet aucun contrôle n'est possible : tout le lot est rejeté
+        anomalies.append({'controle': 'colonne_manquante', 'gravite': 'erreur',
+                          'colonne': ', '.join(manquantes), 'partition': '*',
+                          'lignes': len(lot), 'exemple': None})
+        partitions = (cles_partition(lot, jeu) if colonne_partition(jeu) in lot
+                      else pd.Series('*', index=lot.index))
+        return _rapport(jeu, lot, anomalies, partitions, pd.Series('rejetee', index=lot.index),
+                        lot.iloc[0:0], debut)
+
+    partitions = cles_partition(lot, jeu)
+    donnees, masques = _convertir(lot, schema)
+    if lot.empty:
+        # Aucune partition à contrôler ni à intégrer
+        return _rapport(jeu, lot, anomalies, partitions, pd.Series('acceptee', index=lot.index),
+                        donnees, debut)
+
+    if 'territoire' in schema:
+        territoires = donnees['territoire']
+        masques.append(('territoire_inconnu', 'erreur', 'territoire',
+                        territoires.notna() & ~territoires.isin(TERRITOIRES)))
+
+    for colonne in COLONNES_TAUX:
+        if colonne in schema:
+            taux = donnees[colonne]
+            masques.append(('taux_hors_bornes', 'erreur', colonne,
+                            taux.notna() & ~taux.between(0, 100)))
+
+    if 'annee' in schema:
+        masques.extend(_controles_series(donnees, jeu, reference, seuil_saut))
+
+    # Agrégation par partition : une erreur la rejette, une alerte la met en quarantaine
+    statuts = pd.Series('acceptee', index=pd.unique(partitions))
+    for controle, gravite, colonne, masque in masques:
+        if not masque.any():
+            continue
+        fautives = partitions[masque]
+        exemples = fautives.index.to_series().groupby(fautives.values, sort=False).first()
+        for partition, nombre in fautives.value_counts(sort=False).items():
+            anomalies.append({'controle': controle, 'gravite': gravite, 'colonne': colonne,
+                              'partition': partition, 'lignes': int(nombre),
+                              'exemple': int(exemples[partition])})
+        if gravite == 'alerte':
+            touchees = statuts.index.isin(fautives.unique()) & (statuts != 'rejetee')
+            statuts[touchees] = 'quarantaine'
+        elif gravite == 'erreur':
+            statuts[statuts.index.isin(fautives.unique())] = 'rejetee'
+
+    statut_lignes = partitions.map(statuts)
+    acceptees = donnees[statut_lignes == 'acceptee']
+    types_entiers = {colonne: 'int64' for colonne, type_ in schema.items() if type_ == 'int'}
+    return _rapport(jeu, lot, anomalies, partitions, statut_lignes,
+                    acceptees.astype(types_entiers), debut)
+
+
+def _rapport(jeu, lot, anomalies, partitions, statut_lignes, acceptees, debut):
+    """Assemble le rapport structuré d'une validation (`partitions` : clé de partition par ligne)"""
+    anomalies = pd.DataFrame(anomalies, columns=['controle', 'gravite', 'colonne',
+                                                 'partition', 'lignes', 'exemple'])
+    statut_partitions = (pd.DataFrame({'partition': partitions, 'statut': statut_lignes})
+                         .drop_duplicates('partition')
+                         .set_index('partition')['statut'])
+    return {
+        'jeu': jeu,
+        'lignes': len(lot),
+        'partitions': statut_partitions,
+        'anomalies': anomalies,
+        'acceptees': acceptees.reset_index(drop=True),
+        'quarantaine': lot[statut_lignes == 'quarantaine'],
+        'rejetees': lot[statut_lignes == 'rejetee'],
+        'duree': time.perf_counter() - debut,
+    }
+
+
+def integrer_lot(existant, acceptees, jeu):
+    """Fusionne les lignes acceptées dans les données chargées ; une clé existante est remplacée"""
+    if acceptees.empty:
+        return existant
+    cles = cles_serie(jeu)
+    return (pd.concat([existant, acceptees[existant.columns]], ignore_index=True)
+            .drop_duplicates(cles, keep='last')
+            .sort_values(cles)
+            .reset_index(drop=True))